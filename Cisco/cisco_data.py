@@ -0,0 +1,126 @@
+"""
+cisco_data.py
+
+Shared loader for the Cisco db imports used by the tests and scripts in this
+folder (03062025_cisco_db_import.csv, 06052025_cisco_db_import.csv/.xlsx).
+
+ - load_cisco_import(path): one parse with stripped headers and text dtypes
+   for the identifier / list-valued columns.
+ - CiscoDataset: wraps one loaded frame (treat it as read-only) and computes
+   derived columns lazily, once: stripped text, numeric ranks, parsed rank lists.
+ - CiscoDatasets: session cache of CiscoDataset per file name (see conftest.py).
+
+The shared loaders come from the repository root: pytest puts it on the path
+(pytest.ini); run the scripts here with PYTHONPATH=.. python <script>.py.
+"""
+
+import os
+import ast
+import numpy as np
+import pandas as pd
+
+# shared loaders at the repository root (on the path via pytest.ini)
+from ingest import load_table, read_header
+from import_schema import column_kind
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Cisco import file names shared by the tests and scripts in this folder
+CISCO_IMPORT_0306 = "03062025_cisco_db_import.csv"
+CISCO_IMPORT_0605 = "06052025_cisco_db_import.csv"
+
+# Columns that must stay text (never numeric-inferred) across all Cisco imports
+CISCO_TEXT_COLUMNS = ("option_part_no", "server_description", "dimm_ranks", "server_dimm_ranks")
+
+
+def parse_rank_list(cell) -> list[str]:
+    """Parse a Python‐literal or comma‐sep list into a flat list of combos."""
+    text = str(cell).strip()
+    if not text or text.lower() in ("nan", "[]"):
+        return []
+    try:
+        parsed = ast.literal_eval(text)
+    except Exception:
+        # fallback: split on commas
+        return [s.strip().strip("'\"") for s in text.split(",") if s.strip()]
+    def _flatten(x):
+        for item in x:
+            if isinstance(item, (list, tuple)):
+                yield from _flatten(item)
+            else:
+                yield str(item).strip().strip("'\"")
+    return list(_flatten(parsed))
+
+
+def resolve_cisco_path(name: str) -> str:
+    """Look for `name` next to this folder first, then in the working directory."""
+    for candidate in (os.path.join(HERE, name), os.path.abspath(name)):
+        if os.path.exists(candidate):
+            return candidate
+    raise FileNotFoundError(f"Cisco import '{name}' not found in {HERE} or {os.getcwd()}")
+
+
+def load_cisco_import(path: str) -> pd.DataFrame:
+    """
+    Load one Cisco import (CSV or Excel) with stripped headers, text id/list
+    columns and categorical low-cardinality columns (import_schema); numeric
+    columns keep pandas inference so reports print values as before.
+    """
+    header = read_header(path)
+    dtype = {c: 'category' for c in header if column_kind(str(c).strip().lower()) == 'category'}
+    dtype.update({c: str for c in header if str(c).strip() in CISCO_TEXT_COLUMNS})
+    df = load_table(path, dtype=dtype)
+    df.columns = df.columns.str.strip()
+    return df
+
+
+class CiscoDataset:
+    """One loaded Cisco import plus lazily computed, cached derived columns."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.frame = load_cisco_import(path)
+        self._derived = {}
+
+    def _cached(self, key, build):
+        if key not in self._derived:
+            self._derived[key] = build()
+        return self._derived[key]
+
+    def stripped(self, col: str) -> pd.Series:
+        """Column as str with surrounding whitespace removed (NaN -> 'nan')."""
+        return self._cached(("stripped", col), lambda: self.frame[col].astype(str).str.strip())
+
+    def numeric(self, col: str) -> pd.Series:
+        """Column coerced to numbers (unparseable -> NaN)."""
+        return self._cached(("numeric", col), lambda: pd.to_numeric(self.frame[col], errors="coerce"))
+
+    def rank_lists(self, col: str, parse=None) -> tuple[np.ndarray, list]:
+        """
+        Column parsed once per distinct stripped cell with `parse` (default
+        parse_rank_list): (per-row codes into the parsed list, parsed values).
+        Cached per column and parser.
+        """
+        parse = parse or parse_rank_list
+        def build():
+            codes, uniques = pd.factorize(self.stripped(col))
+            return codes, [parse(u) for u in uniques]
+        return self._cached(("rank_lists", col, parse), build)
+
+
+class CiscoDatasets:
+    """Per-session cache: each Cisco import is parsed at most once."""
+
+    def __init__(self):
+        self._datasets = {}
+
+    def get(self, name: str) -> CiscoDataset:
+        """
+        Return the dataset for file `name`, loading it on first use.
+        Raises FileNotFoundError / EmptyDataError like a direct read would.
+        """
+        path = resolve_cisco_path(name)
+        if path not in self._datasets:
+            self._datasets[path] = CiscoDataset(path)
+        return self._datasets[path]
+
@@ -0,0 +1,14 @@
+import pytest
+
+from cisco_data import CiscoDatasets
+
+
+@pytest.fixture(scope="session")
+def cisco_datasets():
+    """
+    Session-wide Cisco dataset provider. Each import is parsed once (stripped
+    headers, text id/list columns) and shared read-only by every Cisco test;
+    derived columns (stripped text, numeric ranks, parsed rank lists) are
+    computed lazily on the dataset and cached there.
+    """
+    return CiscoDatasets()
@@ -1,7 +1,9 @@
 import re
 import pytest
+import numpy as np
 import pandas as pd
-import os
+
+from cisco_data import CISCO_IMPORT_0306
 
 # ─── 1. UPDATED VALIDATOR ───────────────────────────────────────────────────────
 
@@ -40,22 +42,52 @@ def is_valid_optional_part_number(s: str) -> bool:
 
 # ─── 2. POWER-LIKE SUFFIXES DETECTOR ──────────────────────────────────────────
 
+# One end-anchored pattern, one named group per suffix family. re.search reports
+# the leftmost match, and at a given position the first listed family wins.
+POWER_SUFFIX_FAMILIES = {
+    "dash_h":   r"-H\d+",         # e.g., -H1, -H2
+    "re":       r"RE\d+",         # e.g., RE1, RE3
+    "w":        r"W\d+",          # e.g., W1, W2
+    "s_k":      r"S\d+K\d+",      # e.g., S4K1, S10K2
+    "letter_k": r"[A-Z]\d+K\d+",  # e.g., T10K3, D12K1
+    "rw":       r"RW\d+",         # e.g., RW1, RW2
+    "kam":      r"KAM\d+",        # e.g., KAM1
+    "kl":       r"KL\d+[K|N]\d+", # e.g., KL4K1, KL4KN1
+}
+POWER_SUFFIX_RE = re.compile(
+    "(?:" + "|".join(f"(?P<{name}>{pat})" for name, pat in POWER_SUFFIX_FAMILIES.items()) + ")$"
+)
+
 def looks_like_power_suffix(product_id: str) -> bool:
     """
     Flags product IDs that appear to have power-based or revision-related suffixes.
     Examples: -H1, RE1, RE2, W1, S4K1, RW1, RW2, KAM1, KL4K1, KL4KN1.
     """
-    patterns = [
-        r"-H\d+$",        # e.g., -H1, -H2
-        r"RE\d+$",        # e.g., RE1, RE3
-        r"W\d+$",         # e.g., W1, W2
-        r"S\d+K\d+$",     # e.g., S4K1, S10K2
-        r"[A-Z]\d+K\d+$", # e.g., T10K3, D12K1
-        r"RW\d+$",        # e.g., RW1, RW2
-        r"KAM\d+$",       # e.g., KAM1
-        r"KL\d+[K|N]\d+$" # e.g., KL4K1, KL4KN1
-    ]
-    return any(re.search(p, product_id) for p in patterns)
+    return POWER_SUFFIX_RE.search(product_id) is not None
+
+def power_suffix_family(product_id: str):
+    """Name of the POWER_SUFFIX_FAMILIES entry that matched, or None."""
+    m = POWER_SUFFIX_RE.search(product_id)
+    return m.lastgroup if m else None
+
+def classify_option_part_numbers(col: pd.Series) -> pd.DataFrame:
+    """
+    Vectorized format + power-suffix check over a whole option_part_no column.
+    Returns a frame aligned to `col` with:
+      option_part_no  the value as checked (NaN -> "")
+      valid_format    True for blanks or values matching VALID_PART_NUM_RE
+      suffix_family   POWER_SUFFIX_FAMILIES key of the trailing suffix, else NaN
+    """
+    pn = col.fillna("").astype(str)
+    groups = pn.str.extract(POWER_SUFFIX_RE)
+    hit = groups.notna()
+    family = hit.idxmax(axis=1).where(hit.any(axis=1)) if len(pn) else pd.Series(dtype=object)
+    return pd.DataFrame({
+        "option_part_no": pn,
+        "valid_format": pn.eq("") | pn.str.fullmatch(VALID_PART_NUM_RE.pattern,
+                                                     flags=VALID_PART_NUM_RE.flags),
+        "suffix_family": family,
+    })
 
 
 # ─── 3. SMOKE TESTS BASED ON YOUR DATA ──────────────────────────────────────────
@@ -77,18 +109,12 @@ def test_validator_against_samples(pn, expected):
 # ─── 4. FULL-COLUMN ASSERTION WITH REPORT ──────────────────────────────────────
 
 @pytest.fixture
-def df_option_parts():
+def df_option_parts(cisco_datasets):
     """
-    Adjust this `path` to point at your actual file (CSV or Excel).
-    The code will choose read_csv vs. read_excel automatically.
+    The shared Cisco import (parsed once per session, see conftest.py).
+    Adjust CISCO_IMPORT_0306 in cisco_data.py to point at another file (CSV or Excel).
     """
-    path = "03062025_cisco_db_import.csv"  # or "06052025_cisco_db_import.xlsx"
-    ext = os.path.splitext(path)[1].lower()
-
-    if ext == ".csv":
-        return pd.read_csv(path)
-    else:
-        return pd.read_excel(path)
+    return cisco_datasets.get(CISCO_IMPORT_0306).frame
 
 
 def test_all_option_part_numbers_in_excel(df_option_parts):
@@ -97,24 +123,57 @@ def test_all_option_part_numbers_in_excel(df_option_parts):
     assert it matches our updated UCS/UCSX-hyphen-optional pattern.
     Invalid rows (if any) are written to a CSV report.
     """
-    col = df_option_parts["option_part_no"].fillna("")  # Replace NaNs with empty string
-
-    invalid_rows = []
-    for idx, pn in col.items():
-        if pn and not is_valid_optional_part_number(pn):
-            invalid_rows.append({"row_index": idx, "option_part_no": pn, "reason": "Invalid format"})
-        # elif pn and is_invalid_product_id(pn):
-        #     invalid_rows.append({"row_index": idx, "option_part_no": pn, "reason": "Power-style suffix"})
-        elif pn and looks_like_power_suffix(pn):
-            invalid_rows.append({"row_index": idx, "option_part_no": pn, "reason": "Power-style suffix"})
-
-    if invalid_rows:
-        # Create a DataFrame for invalid rows and write to CSV
-        report_df = pd.DataFrame(invalid_rows)
-        report_df.to_csv("invalid_option_part_numbers_report.csv002", index=False)
+    checks = classify_option_part_numbers(df_option_parts["option_part_no"])
+    non_blank = checks["option_part_no"] != ""
+    bad_format = non_blank & ~checks["valid_format"]
+    power_suffix = non_blank & checks["valid_format"] & checks["suffix_family"].notna()
+
+    flagged = checks[bad_format | power_suffix]
+    invalid_rows = pd.DataFrame({
+        "row_index": flagged.index,
+        "option_part_no": flagged["option_part_no"].to_numpy(),
+        "reason": np.where(bad_format[flagged.index], "Invalid format", "Power-style suffix"),
+        "suffix_family": flagged["suffix_family"].where(power_suffix[flagged.index]).to_numpy(),
+    })
+
+    if not invalid_rows.empty:
+        # Write the invalid rows to CSV
+        invalid_rows.to_csv("invalid_option_part_numbers_report.csv002", index=False)
 
     # Assert no invalid part numbers were found
-    assert not invalid_rows, (
+    assert invalid_rows.empty, (
         f"Found {len(invalid_rows)} invalid part numbers. "
         "See invalid_option_part_numbers_report.csv for details."
     )
+
+
+# ─── 5. MICRO-BENCHMARK ─────────────────────────────────────────────────────────
+
+def _legacy_power_suffix(product_id: str) -> bool:
+    """Previous implementation: rebuilds the pattern list and searches each one."""
+    patterns = [r"-H\d+$", r"RE\d+$", r"W\d+$", r"S\d+K\d+$", r"[A-Z]\d+K\d+$",
+                r"RW\d+$", r"KAM\d+$", r"KL\d+[K|N]\d+$"]
+    return any(re.search(p, product_id) for p in patterns)
+
+def benchmark_option_part_checks(n_rows: int = 200_000, repeat: int = 3):
+    """Compare the per-row Python loop with classify_option_part_numbers on synthetic data."""
+    import timeit
+    samples = ["UCSX-MRX96G2RF3", "UCS-MR-X8G1RS-H", "UCS-PSU1-1050W1", "UCSX-CPU-RE2",
+               "UCS MR X8G1RS H", "UCSC-KL4KN1", "", "UCSXS960G6I1XEV-D"]
+    col = pd.Series((samples * (n_rows // len(samples) + 1))[:n_rows])
+
+    def loop():
+        return [(pn and not is_valid_optional_part_number(pn), pn and _legacy_power_suffix(pn))
+                for pn in col.fillna("")]
+
+    def vectorized():
+        return classify_option_part_numbers(col)
+
+    t_loop = min(timeit.repeat(loop, number=1, repeat=repeat))
+    t_vec = min(timeit.repeat(vectorized, number=1, repeat=repeat))
+    print(f"{n_rows} rows: loop {t_loop:.3f}s, vectorized {t_vec:.3f}s "
+          f"({t_loop / t_vec:.1f}x)")
+
+
+if __name__ == "__main__":
+    benchmark_option_part_checks()
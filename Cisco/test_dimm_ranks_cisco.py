@@ -1,82 +1,129 @@
 import os
 import csv
 import ast
+import numpy as np
 import pandas as pd
 import pytest
+from functools import lru_cache
 from pandas.errors import EmptyDataError
 
-def test_dimm_ranks_and_write_csv():
-    base_dir = os.path.dirname(__file__)
-    csv_path = os.path.join(base_dir, "03062025_cisco_db_import.csv")
+from cisco_data import CISCO_IMPORT_0306
+
 
-    if not os.path.exists(csv_path):
-        pytest.fail(f"CSV not found at {csv_path}")
+def _flatten(x):
+    for i in x:
+        if isinstance(i, (list, tuple)):
+            yield from _flatten(i)
+        else:
+            yield str(i).strip().strip("'\"")
 
+
+@lru_cache(maxsize=None)
+def parse_dimm_ranks_cell(cell: str) -> tuple[str, ...]:
+    """
+    Parse one dimm_ranks cell (Python literal or bare value) into its flat
+    combos. Memoized: each distinct cell string is parsed exactly once.
+    """
+    if cell.lower() in ("nan", "", "[]"):
+        return ()
     try:
-        df = pd.read_csv(csv_path)
-    except EmptyDataError:
-        pytest.fail(f"No data found in CSV at {csv_path}")
+        lst = ast.literal_eval(cell)
+    except Exception:
+        lst = [cell]
+    if not isinstance(lst, (list, tuple)):
+        lst = [lst]
+    combos = []
+    for combo in _flatten(lst):
+        c = combo.strip()
+        if c and c.lower() != "nan":
+            combos.append(c)
+    return tuple(combos)
+
+
+def _join_sorted(values) -> str:
+    return ",".join(sorted(values))
+
+
+def validate_dimm_ranks(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Compare expected vs actual DIMM-rank combos for every option_part_no at once.
+
+    expected: per-part cross product of distinct ranks x rank_width -> "{r}Rx{w}"
+    actual:   per-part union of the dimm_ranks combos (already parsed: one
+              tuple per row, see parse_dimm_ranks_cell)
+    Both sides are long (option_part_no, combo) tables; missing/extra come from
+    one outer merge instead of a Python loop per part.
+
+    Returns one row per option_part_no with missing, extra, status, matched_combos.
+    """
+    key = "option_part_no"
+
+    # expected: distinct (part, rank) x distinct (part, width), merged on part
+    ranks  = df[[key, "ranks"]].dropna().drop_duplicates()
+    widths = df[[key, "rank_width"]].dropna().drop_duplicates()
+    expected = ranks.merge(widths, on=key)
+    expected["combo"] = (
+        expected["ranks"].astype(int).astype(str) + "Rx" +
+        expected["rank_width"].astype(int).astype(str)
+    )
+    expected = expected[[key, "combo"]].drop_duplicates()
+
+    # actual: distinct (part, parsed cell) pairs, exploded to (part, combo)
+    cells = df[[key, "dimm_ranks"]].drop_duplicates()
+    actual = (
+        cells.rename(columns={"dimm_ranks": "combo"}).explode("combo")
+             .dropna(subset=["combo"])[[key, "combo"]]
+             .drop_duplicates()
+    )
+
+    both = expected.merge(actual, on=[key, "combo"], how="outer", indicator=True)
+    missing = both[both["_merge"] == "left_only"].groupby(key)["combo"].agg(_join_sorted)
+    extra   = both[both["_merge"] == "right_only"].groupby(key)["combo"].agg(_join_sorted)
+    matched = expected.groupby(key)["combo"].agg(_join_sorted)
+
+    report = pd.DataFrame(index=pd.Index(sorted(df[key].unique()), name=key))
+    report["missing"] = missing.reindex(report.index).fillna("")
+    report["extra"]   = extra.reindex(report.index).fillna("")
+    report["status"]  = (
+        (report["missing"] == "") & (report["extra"] == "")
+    ).map({True: "PASS", False: "FAIL"})
+    report["matched_combos"] = matched.reindex(report.index).fillna("")
+    return report.reset_index()
+
+
+def test_dimm_ranks_and_write_csv(cisco_datasets):
+    base_dir = os.path.dirname(__file__)
 
-    # normalize column names
-    df.columns = df.columns.str.strip()
+    # shared session dataset: headers already stripped, parsed once
+    try:
+        ds = cisco_datasets.get(CISCO_IMPORT_0306)
+    except FileNotFoundError as e:
+        pytest.fail(str(e))
+    except EmptyDataError:
+        pytest.fail(f"No data found in CSV '{CISCO_IMPORT_0306}'")
 
     # ensure required columns
     for col in ("option_part_no", "ranks", "rank_width", "dimm_ranks"):
-        if col not in df.columns:
+        if col not in ds.frame.columns:
             pytest.fail(f"Missing required column '{col}' in CSV")
 
-    # strip and convert types
-    df["option_part_no"] = df["option_part_no"].astype(str).str.strip()
-    df["dimm_ranks"]     = df["dimm_ranks"].astype(str).str.strip()
-    df["ranks"]          = pd.to_numeric(df["ranks"], errors="coerce")
-    df["rank_width"]     = pd.to_numeric(df["rank_width"], errors="coerce")
-
-    report_rows = []
-    validated_rows = []
-
-    for part_no, group in df.groupby("option_part_no"):
-        # expected combos
-        valid_rs = group["ranks"].dropna().unique().astype(int)
-        valid_ws = group["rank_width"].dropna().unique().astype(int)
-        expected = {f"{r}Rx{w}" for r in valid_rs for w in valid_ws}
-
-        # parse actual dimm_ranks into a flat set
-        actual = set()
-        for cell in group["dimm_ranks"].dropna().astype(str):
-            if cell.lower() in ("nan", "", "[]"):
-                continue
-            try:
-                lst = ast.literal_eval(cell)
-            except Exception:
-                lst = [cell]
-            def _flatten(x):
-                for i in x:
-                    if isinstance(i, (list, tuple)):
-                        yield from _flatten(i)
-                    else:
-                        yield str(i).strip().strip("'\"")
-            for combo in _flatten(lst):
-                c = combo.strip()
-                if c and c.lower() != "nan":
-                    actual.add(c)
-
-        missing = sorted(expected - actual)
-        extra   = sorted(actual - expected)
-        status  = "PASS" if not missing and not extra else "FAIL"
-
-        report_rows.append({
-            "option_part_no": part_no,
-            "missing": ",".join(missing),
-            "extra": ",".join(extra),
-            "status": status
-        })
-
-        if status == "PASS":
-            # record matched combos for passed parts
-            validated_rows.append({
-                "option_part_no": part_no,
-                "matched_combos": ",".join(sorted(expected))
-            })
+    # stripped / numeric / parsed views come from the dataset's cached derived columns
+    codes, parsed = ds.rank_lists("dimm_ranks", parse_dimm_ranks_cell)
+    parsed_by_code = np.empty(len(parsed), dtype=object)
+    parsed_by_code[:] = parsed
+    df = pd.DataFrame({
+        "option_part_no": ds.stripped("option_part_no"),
+        "dimm_ranks":     parsed_by_code[codes],
+        "ranks":          ds.numeric("ranks"),
+        "rank_width":     ds.numeric("rank_width"),
+    })
+
+    report_df = validate_dimm_ranks(df)
+    report_rows = report_df[["option_part_no", "missing", "extra", "status"]].to_dict("records")
+    validated_rows = (
+        report_df.loc[report_df["status"] == "PASS", ["option_part_no", "matched_combos"]]
+                 .to_dict("records")
+    )
 
     # write full report
     report_path = os.path.join(base_dir, "dimm_ranks_report.csv")
@@ -1,233 +1,226 @@
 import os
-import csv
-import ast
+import numpy as np
 import pandas as pd
 import pytest
 import re
+from collections import Counter
 from pandas.errors import EmptyDataError
 
-# 1) Point to the CSV once
-CSV_PATH = os.path.join(os.path.dirname(__file__), "03062025_cisco_db_import.csv")
+from cisco_data import CISCO_IMPORT_0306
 
+# 1) Shared session dataset (see conftest.py / cisco_data.py)
 @pytest.fixture(scope="session")
-def df():
+def dataset(cisco_datasets):
     """
-    Load the CSV into a DataFrame once per session.
-    Skip all tests if mismatch or empty.
+    The shared 03062025 Cisco import, parsed once per session.
+    Skip all tests if missing or empty.
     """
-    if not os.path.exists(CSV_PATH):
-        pytest.skip(f"CSV not found at {CSV_PATH}")
     try:
-        data = pd.read_csv(CSV_PATH)
+        return cisco_datasets.get(CISCO_IMPORT_0306)
+    except FileNotFoundError as e:
+        pytest.skip(str(e))
     except EmptyDataError:
-        pytest.skip(f"No data found in CSV at {CSV_PATH}")
-    data.columns = data.columns.str.strip()
-    return data
-
-# 2) Helper: parse a Python‐literal or comma‐sep list into flat list of combos
-def _parse_list(cell: str) -> list[str]:
-    text = str(cell).strip()
-    if not text or text.lower() in ("nan", "[]"):
-        return []
-    try:
-        parsed = ast.literal_eval(text)
-    except Exception:
-        # fallback: split on commas
-        return [s.strip().strip("'\"") for s in text.split(",") if s.strip()]
-    def _flatten(x):
-        for item in x:
-            if isinstance(item, (list, tuple)):
-                yield from _flatten(item)
-            else:
-                yield str(item).strip().strip("'\"")
-    return list(_flatten(parsed))
+        pytest.skip(f"No data found in CSV '{CISCO_IMPORT_0306}'")
+
+@pytest.fixture(scope="session")
+def df(dataset):
+    return dataset.frame
+
+# 2) Rank-list columns are parsed with parse_rank_list (Python literal or
+#    comma-separated list -> flat combos), once per distinct cell, by
+#    dataset.rank_lists(col): (per-row codes, parsed lists)
 
 # Define the valid DIMM rank values based on the checkboxes
 VALID_DIMM_RANKS = {"1Rx2", "1Rx4", "1Rx8","1Rx16","2Rx4", "2Rx8","2Rx16","3Rx4","4Rx4","4Rx8", "8Rx4"}
 
+# One bit per valid combo, so a row's rank set fits in a uint16
+DIMM_RANK_BITS = {rank: 1 << i for i, rank in enumerate(sorted(VALID_DIMM_RANKS))}
+
 # Regular expression to strictly validate DIMM rank pattern like '1Rx2', '2Rx4', etc.
 DIMM_RANK_PATTERN = re.compile(r'^\dRx\d$')  # Only allows one digit for rank and width
 
-def _validate_dimm_ranks(dimm_ranks_list: list[str]) -> tuple[list[str], list[str]]:
-    """
-    Validate DIMM ranks against the valid set.
-    Returns (valid_ranks, invalid_ranks)
-    """
-    valid_ranks = []
-    invalid_ranks = []
-    
-    for rank in dimm_ranks_list:
-        if rank in VALID_DIMM_RANKS:
-            valid_ranks.append(rank)
-        else:
-            invalid_ranks.append(rank)
-    
-    return valid_ranks, invalid_ranks
-
-def test_dimm_ranks_row_level(df: pd.DataFrame):
+def _exploded(parsed: list[list[str]]) -> pd.DataFrame:
+    """Long (code, rank, pos) frame over the distinct parsed lists."""
+    lengths = [len(p) for p in parsed]
+    return pd.DataFrame({
+        "code": np.repeat(np.arange(len(parsed)), lengths),
+        "rank": [r for p in parsed for r in p],
+        "pos":  [i for n in lengths for i in range(n)],
+    })
+
+def test_dimm_ranks_row_level(df: pd.DataFrame, dataset):
     """
-    Row-by-row: Build exactly one expected "<rank>Rx<width>" per row,
-    parse that row's dimm_ranks, and assert the expected pattern matches.
+    Build exactly one expected "<rank>Rx<width>" per row, parse that row's
+    dimm_ranks, and assert the expected pattern matches.
     Also validates all dimm_ranks against the valid set.
     Writes a combined output file with actual and expected columns.
+
+    Column-wise: expected comes from to_numeric + string concatenation,
+    dimm_ranks is parsed once per distinct value, and both the
+    VALID_DIMM_RANKS membership and "expected in actual" are evaluated on an
+    exploded (cell, rank) frame.
     """
     # Ensure columns exist
     for col in ("server_description", "option_part_no", "ranks", "rank_width", "dimm_ranks"):
         assert col in df.columns, f"Missing required column '{col}'"
-    
-    report = []
-    for idx, row in df.iterrows():
-        part_no = str(row["option_part_no"]).strip()
-        server_desc = str(row["server_description"]).strip()  # Capture the server description
-        
-        # Build expected pattern like "<rank>Rx<width>"
-        try:
-            r = int(float(row["ranks"]))
-            w = int(float(row["rank_width"]))
-            expected = f"{r}Rx{w}"
-        except Exception:
-            report.append({
-                "row": idx,
-                "server_description": server_desc,
-                "option_part_no": part_no,
-                "expected": "",
-                "actual": "",
-                "mismatch": "",
-                "status": "SKIP"
-            })
-            continue
-
-        # Parse dimm_ranks as a list and validate against valid set
-        actual_list = _parse_list(row["dimm_ranks"])
-        valid_ranks, invalid_ranks = _validate_dimm_ranks(actual_list)
-        
-        actual_set = set(actual_list)
-        status = "PASS"
-        mismatch = ""
-        
-        # Check for invalid ranks
-        if invalid_ranks:
-            status = "FAIL"
-            mismatch = f"Invalid dimm_ranks found: {', '.join(invalid_ranks)}"
-        
-        # Check if expected pattern is present (only if no invalid ranks)
-        if not invalid_ranks and expected not in actual_set:
-            status = "FAIL"
-            if mismatch:
-                mismatch += f"; Expected '{expected}' not found in dimm_ranks"
-            else:
-                mismatch = f"Expected '{expected}' not found in dimm_ranks"
-        
-        report.append({
-            "row": idx,
-            "server_description": server_desc,
-            "option_part_no": part_no,
-            "expected": expected,
-            "actual": ",".join(sorted(actual_set)),
-            "mismatch": mismatch,
-            "status": status
-        })
+
+    # Build expected pattern like "<rank>Rx<width>"; rows without both numbers are skipped
+    r = pd.to_numeric(df["ranks"], errors="coerce")
+    w = pd.to_numeric(df["rank_width"], errors="coerce")
+    has_expected = (np.isfinite(r) & np.isfinite(w)).to_numpy()
+    expected = pd.Series("", index=df.index, dtype=object)
+    expected[has_expected] = (
+        r[has_expected].astype(int).astype(str) + "Rx" + w[has_expected].astype(int).astype(str)
+    )
+
+    # Parse each distinct dimm_ranks value once and explode it
+    codes, parsed = dataset.rank_lists("dimm_ranks")
+    long = _exploded(parsed)
+    long["invalid"] = ~long["rank"].isin(VALID_DIMM_RANKS)
+
+    n_cells = len(parsed)
+    actual_by_code = np.array([",".join(sorted(set(p))) for p in parsed], dtype=object)
+    invalid_by_code = (
+        long[long["invalid"]].groupby("code")["rank"].agg(", ".join)
+            .reindex(range(n_cells), fill_value="").to_numpy()
+    )
+
+    # "expected in actual": merge (row, code, expected) against exploded (code, rank)
+    rows = pd.DataFrame({"code": codes, "rank": expected.to_numpy()})
+    hits = rows.reset_index().merge(long[["code", "rank"]].drop_duplicates(), on=["code", "rank"])
+    expected_found = np.zeros(len(df), dtype=bool)
+    expected_found[hits["index"].to_numpy()] = True
+
+    invalid = invalid_by_code[codes] if n_cells else np.full(len(df), "", dtype=object)
+    has_invalid = invalid != ""
+    missing_expected = ~has_invalid & ~expected_found
+
+    mismatch = np.where(
+        has_invalid,
+        "Invalid dimm_ranks found: " + invalid.astype(str),
+        np.where(missing_expected, "Expected '" + expected.to_numpy().astype(str) + "' not found in dimm_ranks", ""),
+    )
+    status = np.where(has_invalid | missing_expected, "FAIL", "PASS")
+
+    report = pd.DataFrame({
+        "row": df.index,
+        "server_description": df["server_description"].astype(str).str.strip().to_numpy(),
+        "option_part_no": df["option_part_no"].astype(str).str.strip().to_numpy(),
+        "expected": expected.to_numpy(),
+        "actual": actual_by_code[codes] if n_cells else "",
+        "mismatch": mismatch,
+        "status": status,
+    })
+    skip = ~has_expected
+    report.loc[skip, ["actual", "mismatch"]] = ""
+    report.loc[skip, "status"] = "SKIP"
 
     # Write the combined report to CSV
     out_path = os.path.join(os.path.dirname(__file__), "dimm_ranks_combined_report.csv")
-    with open(out_path, "w", newline="") as fp:
-        writer = csv.DictWriter(
-            fp,
-            fieldnames=["row", "server_description", "option_part_no", "expected", "actual", "mismatch", "status"]
-        )
-        writer.writeheader()
-        writer.writerows(report)
+    report.to_csv(out_path, index=False)
 
     # Fail if any row has a FAIL status
-    fails = [r for r in report if r["status"] == "FAIL"]
-    if fails:
-        parts = [f"{r['option_part_no']}(row {r['row']})" for r in fails]
+    fails = report[report["status"] == "FAIL"]
+    if not fails.empty:
+        parts = [f"{p}(row {i})" for p, i in zip(fails["option_part_no"], fails["row"])]
         pytest.fail(
             f"DIMM-ranks validation failed in rows: {parts}\n"
             f"See 'dimm_ranks_combined_report.csv' for details."
         )
 
-def test_dimm_ranks_presence_in_server(df: pd.DataFrame):
+def _encode_rank_cells(parsed: list[list[str]]) -> dict[str, np.ndarray]:
+    """
+    Encode each distinct parsed rank list once:
+      mask        uint16 with one bit per valid NRxW combo present
+      invalid     comma-joined sorted invalid entries (report column)
+      invalid_msg ", "-joined invalid entries in original order (issue text)
+      listed      comma-joined sorted entries (report column)
+      duplicates  ", "-joined entries that occur more than once
     """
-    Row-by-row: parse single‐value dimm_ranks and list‐value server_dimm_ranks,
+    masks = np.zeros(len(parsed), dtype=np.uint16)
+    invalid, invalid_msg, listed, duplicates = [], [], [], []
+    for i, ranks in enumerate(parsed):
+        bad = [r for r in ranks if r not in DIMM_RANK_BITS]
+        for r in ranks:
+            if r in DIMM_RANK_BITS:
+                masks[i] |= DIMM_RANK_BITS[r]
+        counts = Counter(ranks)
+        invalid.append(",".join(sorted(bad)))
+        invalid_msg.append(", ".join(bad))
+        listed.append(",".join(sorted(ranks)))
+        duplicates.append(", ".join(sorted(r for r, n in counts.items() if n > 1)))
+    obj = lambda xs: np.array(xs, dtype=object)
+    return {"mask": masks, "invalid": obj(invalid), "invalid_msg": obj(invalid_msg),
+            "listed": obj(listed), "duplicates": obj(duplicates)}
+
+def _decode_rank_mask(masks: np.ndarray) -> np.ndarray:
+    """Map each uint16 rank mask to its ", "-joined combo names (decoded once per distinct mask)."""
+    uniq, inverse = np.unique(masks, return_inverse=True)
+    names = np.array(
+        [", ".join(r for r, bit in DIMM_RANK_BITS.items() if m & bit) for m in uniq],
+        dtype=object,
+    )
+    return names[inverse]
+
+def _append_issue(issues: np.ndarray, label: str, detail: np.ndarray) -> np.ndarray:
+    """Vectorized '; '-join of an optional issue onto the running issue strings."""
+    text = np.where(detail != "", label + detail.astype(object), "")
+    sep = np.where((issues != "") & (text != ""), "; ", "")
+    return issues + sep + text
+
+def test_dimm_ranks_presence_in_server(df: pd.DataFrame, dataset):
+    """
+    Parse single‐value dimm_ranks and list‐value server_dimm_ranks,
     assert every dimm_rank appears in the server list.
     Validates both dimm_ranks and server_dimm_ranks against the valid set.
     Checks for duplicates in server_dimm_ranks and writes a combined output file.
+
+    Each distinct cell is parsed and encoded once into a uint16 rank mask
+    (one bit per VALID_DIMM_RANKS combo); the subset check is then a single
+    NumPy `dimm & ~server` over the whole column.
     """
     # Ensure columns exist
     for col in ("dimm_ranks", "server_dimm_ranks", "server_description"):
         assert col in df.columns, f"Missing required column '{col}'"
 
-    # Initialize the report
-    report = []
-
-    # Iterate through each row
-    for idx, row in df.iterrows():
-        dimm_list = _parse_list(row["dimm_ranks"])
-        server_dimm_ranks = _parse_list(row["server_dimm_ranks"])
-        server_desc = str(row["server_description"]).strip()  # Capture the server description
-
-        # Validate dimm_ranks against valid set
-        valid_dimm_ranks, invalid_dimm_ranks = _validate_dimm_ranks(dimm_list)
-        
-        # Validate server_dimm_ranks against valid set
-        valid_server_ranks, invalid_server_ranks = _validate_dimm_ranks(server_dimm_ranks)
-        
-        dimm_set = set(valid_dimm_ranks)  # Only use valid dimm_ranks for comparison
-        server_set = set(valid_server_ranks)  # Only use valid server_dimm_ranks for comparison
-
-        status = "PASS"
-        issues = []
-
-        # Check for invalid entries in dimm_ranks
-        if invalid_dimm_ranks:
-            status = "FAIL"
-            issues.append(f"Invalid dimm_ranks: {', '.join(invalid_dimm_ranks)}")
-
-        # Check for invalid entries in server_dimm_ranks
-        if invalid_server_ranks:
-            status = "FAIL"
-            issues.append(f"Invalid server_dimm_ranks: {', '.join(invalid_server_ranks)}")
-
-        # Check if all valid dimm_ranks are contained in valid server_dimm_ranks
-        mismatch = dimm_set - server_set
-        if mismatch:
-            status = "FAIL"
-            issues.append(f"dimm_ranks not in server_dimm_ranks: {', '.join(mismatch)}")
-
-        # Check for duplicates in the server_dimm_ranks
-        duplicate_ranks = [item for item in server_dimm_ranks if server_dimm_ranks.count(item) > 1]
-        if duplicate_ranks:
-            status = "FAIL"
-            issues.append(f"Duplicates in server_dimm_ranks: {', '.join(set(duplicate_ranks))}")
-
-        report.append({
-            "row": idx,
-            "server_description": server_desc,
-            "dimm_ranks": ",".join(sorted(dimm_list)),
-            "server_dimm_ranks": ",".join(sorted(server_dimm_ranks)),
-            "invalid_dimm_ranks": ",".join(sorted(invalid_dimm_ranks)) if invalid_dimm_ranks else "",
-            "invalid_server_ranks": ",".join(sorted(invalid_server_ranks)) if invalid_server_ranks else "",
-            "issues": "; ".join(issues) if issues else "",
-            "status": status
-        })
+    d_codes, d_parsed = dataset.rank_lists("dimm_ranks")
+    s_codes, s_parsed = dataset.rank_lists("server_dimm_ranks")
+    d_enc = _encode_rank_cells(d_parsed)
+    s_enc = _encode_rank_cells(s_parsed)
+    take = lambda enc, key, codes: enc[key][codes]
+
+    # dimm_ranks not covered by server_dimm_ranks (valid entries only)
+    not_in_server = take(d_enc, "mask", d_codes) & ~take(s_enc, "mask", s_codes)
+    mismatch = (
+        _decode_rank_mask(not_in_server) if len(df) else np.array([], dtype=object)
+    )
+
+    issues = np.full(len(df), "", dtype=object)
+    issues = _append_issue(issues, "Invalid dimm_ranks: ", take(d_enc, "invalid_msg", d_codes))
+    issues = _append_issue(issues, "Invalid server_dimm_ranks: ", take(s_enc, "invalid_msg", s_codes))
+    issues = _append_issue(issues, "dimm_ranks not in server_dimm_ranks: ", mismatch)
+    issues = _append_issue(issues, "Duplicates in server_dimm_ranks: ", take(s_enc, "duplicates", s_codes))
+
+    report = pd.DataFrame({
+        "row": df.index,
+        "server_description": df["server_description"].astype(str).str.strip().to_numpy(),
+        "dimm_ranks": take(d_enc, "listed", d_codes),
+        "server_dimm_ranks": take(s_enc, "listed", s_codes),
+        "invalid_dimm_ranks": take(d_enc, "invalid", d_codes),
+        "invalid_server_ranks": take(s_enc, "invalid", s_codes),
+        "issues": issues,
+        "status": np.where(issues != "", "FAIL", "PASS"),
+    })
 
     # Write the combined report to CSV
     out_path = os.path.join(os.path.dirname(__file__), "dimm_ranks_combined_report.csv")
-    with open(out_path, "w", newline="") as fp:
-        writer = csv.DictWriter(
-            fp,
-            fieldnames=["row", "server_description", "dimm_ranks", "server_dimm_ranks", 
-                       "invalid_dimm_ranks", "invalid_server_ranks", "issues", "status"]
-        )
-        writer.writeheader()
-        writer.writerows(report)
+    report.to_csv(out_path, index=False)
 
     # Fail if any row has a FAIL status
-    fails = [r for r in report if r["status"] == "FAIL"]
-    if fails:
+    fails = report.loc[report["status"] == "FAIL", "row"]
+    if not fails.empty:
         pytest.fail(
-            f"DIMM ranks validation failed in the following rows: {', '.join(str(r['row']) for r in fails)}\n"
+            f"DIMM ranks validation failed in the following rows: {', '.join(str(r) for r in fails)}\n"
             f"See 'dimm_ranks_combined_report.csv' for details."
         )
 #end of the code
\ No newline at end of file
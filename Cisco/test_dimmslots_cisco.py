@@ -25,6 +25,8 @@ import csv
 import numpy as np
 import pandas as pd
 
+from cisco_data import CISCO_IMPORT_0605, load_cisco_import
+
 def calculate_dimm_rank(row):
     """
     From a row with 'ranks' and 'rank_width', build a string like "1Rx4".
@@ -36,7 +38,7 @@ def calculate_dimm_rank(row):
 
 def main():
     here = os.path.dirname(os.path.abspath(__file__))
-    csv_path = os.path.join(here, "06052025_cisco_db_import.csv")
+    csv_path = os.path.join(here, CISCO_IMPORT_0605)
 
     if not os.path.isfile(csv_path):
         print(f"ERROR: Could not find '06052025_cisco_db_import.csv' in {here}")
@@ -44,7 +46,7 @@ def main():
 
     # Load the CSV into a DataFrame
     try:
-        df = pd.read_csv(csv_path)
+        df = load_cisco_import(csv_path)
     except Exception as e:
         print(f"ERROR: Failed to read 'my_data.csv': {e}")
         sys.exit(1)
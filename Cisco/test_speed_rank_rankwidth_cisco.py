@@ -4,7 +4,7 @@ validate_speed_ranks_rankwidth.py
 
 Standalone script that:
  1. Loads "06052025_cisco_db_import.xlsx" (or CSV if renamed) from the same directory.
- 2. Checks, for each row:
+ 2. Checks, column-wise (no per-row Python loop):
     - That 'speed', 'ranks', and 'rank_width' exist as columns.
     - That 'speed', 'ranks', and 'rank_width' are numeric (or NaN).
     - That no negative values appear in those three columns (NaN is allowed).
@@ -25,6 +25,8 @@ import csv
 import numpy as np
 import pandas as pd
 
+from cisco_data import load_cisco_import
+
 # ────────────────────────────────────────────────────────────────
 # (1) Load the Excel/CSV file
 # ────────────────────────────────────────────────────────────────
@@ -34,7 +36,8 @@ REPORT_FILENAME = "test_report_speed_rank_rankwidth.csv"
 
 def load_input_file(fn: str) -> pd.DataFrame:
     """
-    Load the given file (Excel or CSV) into a pandas DataFrame.
+    Load the given file (Excel or CSV) into a pandas DataFrame
+    through the shared Cisco loader (stripped headers, text id columns).
     """
     here = os.path.dirname(os.path.abspath(__file__))
     path = os.path.join(here, fn)
@@ -43,18 +46,12 @@ def load_input_file(fn: str) -> pd.DataFrame:
         print(f"ERROR: Could not find '{fn}' in {here}")
         sys.exit(1)
 
-    if fn.lower().endswith((".xlsx", ".xls")):
-        try:
-            df = pd.read_excel(path)
-        except Exception as e:
-            print(f"ERROR: Failed to read Excel '{fn}': {e}")
-            sys.exit(1)
-    else:
-        try:
-            df = pd.read_csv(path)
-        except Exception as e:
-            print(f"ERROR: Failed to read CSV '{fn}': {e}")
-            sys.exit(1)
+    try:
+        df = load_cisco_import(path)
+    except Exception as e:
+        kind = "Excel" if fn.lower().endswith((".xlsx", ".xls")) else "CSV"
+        print(f"ERROR: Failed to read {kind} '{fn}': {e}")
+        sys.exit(1)
 
     return df
 
@@ -74,9 +71,11 @@ def check_columns_exist(df: pd.DataFrame):
     return True, ""
 
 # ────────────────────────────────────────────────────────────────
-# (3) Per‐row checks
+# (3) Column-wise checks
 # ────────────────────────────────────────────────────────────────
 
+CHECK_COLUMNS = ["speed", "ranks", "rank_width"]
+
 def is_numeric_or_nan(df: pd.DataFrame, col: str):
     """
     Return True if df[col] has a numeric dtype (ints, floats, or pandas Nullable Int/Float),
@@ -84,13 +83,37 @@ def is_numeric_or_nan(df: pd.DataFrame, col: str):
     """
     return pd.api.types.is_numeric_dtype(df[col])
 
-def check_no_negative_value(val):
+def non_negative_mask(series: pd.Series) -> pd.Series:
+    """
+    Boolean mask: True where the value is NaN or >= 0.
+    Non-numeric columns are coerced first so text cells count as NaN here
+    (they are already reported by the *_is_numeric check).
+    """
+    if not pd.api.types.is_numeric_dtype(series):
+        series = pd.to_numeric(series, errors="coerce")
+    return series.ge(0) | series.isna()
+
+def build_report(df: pd.DataFrame) -> pd.DataFrame:
     """
-    Return True if val is NaN or val >= 0. Otherwise False.
+    Build the per-row report in one go: dtype checks are evaluated once per
+    column and broadcast, non-negative checks are column masks, and
+    overall_status is the AND-reduction of all six sub-check masks.
     """
-    if pd.isna(val):
-        return True
-    return val >= 0
+    report = pd.DataFrame({"row_index": df.index}, index=df.index)
+    for col in CHECK_COLUMNS:
+        report[col] = df[col]
+
+    sub_checks = []
+    for col in CHECK_COLUMNS:
+        numeric_ok = np.full(len(df), is_numeric_or_nan(df, col))
+        non_negative_ok = non_negative_mask(df[col]).to_numpy()
+        report[f"{col}_is_numeric"] = np.where(numeric_ok, "PASS", "FAIL")
+        report[f"{col}_non_negative"] = np.where(non_negative_ok, "PASS", "FAIL")
+        sub_checks.extend([numeric_ok, non_negative_ok])
+
+    all_pass = np.logical_and.reduce(sub_checks) if len(df) else np.array([], dtype=bool)
+    report["overall_status"] = np.where(all_pass, "PASSED", "FAILED")
+    return report
 
 # ────────────────────────────────────────────────────────────────
 # (4) Main logic: run checks and write report
@@ -121,101 +144,15 @@ def main():
         print(f"Report written to {rpt_path}")
         sys.exit(1)
 
-    # Prepare per-row report
-    report_rows = []
-    for idx, row in df.iterrows():
-        # Initialize the dictionary for this row
-        row_report = {
-            "row_index": idx,
-            "speed": row.get("speed", np.nan),
-            "ranks": row.get("ranks", np.nan),
-            "rank_width": row.get("rank_width", np.nan),
-            # Sub-check results (PASS or FAIL):
-            "speed_is_numeric": "",
-            "speed_non_negative": "",
-            "ranks_is_numeric": "",
-            "ranks_non_negative": "",
-            "rank_width_is_numeric": "",
-            "rank_width_non_negative": "",
-            "overall_status": ""
-        }
-
-        # 1) speed_is_numeric
-        if is_numeric_or_nan(df, "speed"):
-            row_report["speed_is_numeric"] = "PASS"
-        else:
-            row_report["speed_is_numeric"] = "FAIL"
-
-        # 2) speed_non_negative
-        if check_no_negative_value(row["speed"]):
-            row_report["speed_non_negative"] = "PASS"
-        else:
-            row_report["speed_non_negative"] = "FAIL"
-
-        # 3) ranks_is_numeric
-        if is_numeric_or_nan(df, "ranks"):
-            row_report["ranks_is_numeric"] = "PASS"
-        else:
-            row_report["ranks_is_numeric"] = "FAIL"
-
-        # 4) ranks_non_negative
-        if check_no_negative_value(row["ranks"]):
-            row_report["ranks_non_negative"] = "PASS"
-        else:
-            row_report["ranks_non_negative"] = "FAIL"
-
-        # 5) rank_width_is_numeric
-        if is_numeric_or_nan(df, "rank_width"):
-            row_report["rank_width_is_numeric"] = "PASS"
-        else:
-            row_report["rank_width_is_numeric"] = "FAIL"
-
-        # 6) rank_width_non_negative
-        if check_no_negative_value(row["rank_width"]):
-            row_report["rank_width_non_negative"] = "PASS"
-        else:
-            row_report["rank_width_non_negative"] = "FAIL"
-
-        # Determine overall_status: PASS only if all six sub-checks are PASS
-        sub_checks = [
-            row_report["speed_is_numeric"],
-            row_report["speed_non_negative"],
-            row_report["ranks_is_numeric"],
-            row_report["ranks_non_negative"],
-            row_report["rank_width_is_numeric"],
-            row_report["rank_width_non_negative"]
-        ]
-        row_report["overall_status"] = (
-            "PASSED" if all(ch == "PASS" for ch in sub_checks) else "FAILED"
-        )
-
-        report_rows.append(row_report)
-
-    # Write the per-row report CSV
+    # Build and write the per-row report CSV in one shot
+    report = build_report(df)
+
     here = os.path.dirname(os.path.abspath(__file__))
     report_path = os.path.join(here, REPORT_FILENAME)
-
-    with open(report_path, "w", newline="") as csvfile:
-        fieldnames = [
-            "row_index",
-            "speed",
-            "ranks",
-            "rank_width",
-            "speed_is_numeric",
-            "speed_non_negative",
-            "ranks_is_numeric",
-            "ranks_non_negative",
-            "rank_width_is_numeric",
-            "rank_width_non_negative",
-            "overall_status"
-        ]
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        for r in report_rows:
-            writer.writerow(r)
+    report.to_csv(report_path, index=False)
 
     # Print a brief summary
-    passed_count = sum(1 for r in report_rows if r["overall_status"] == "PASSED")
+    passed_count = int((report["overall_status"] == "PASSED").sum())
     failed_count = total_rows - passed_count
     print(f"Completed {total_rows} rows → {passed_count} PASSED, {failed_count} FAILED.")
     print(f"Report written to: {report_path}")
@@ -1,7 +1,12 @@
 import os
+import re
+import numpy as np
 import pandas as pd
 import pytest
 
+from ingest import iter_table, load_table, read_header
+from import_schema import schema_dtypes
+
 # ─── CONFIG ───
 # In‐code master brand‐to‐category mapping
 MASTER_CATEGORIES = {
@@ -22,6 +27,7 @@ MASTER_CATEGORIES = {
 # Path to your test data (CSV or Excel)
 TEST_FILE   = '06052025_cisco_db_import.csv'
 OUTPUT_CSV  = 'missing_categories_report.csv'
+CHUNK_ROWS  = 50_000  # rows per chunk when scanning the store/category columns
 
 # ─── HELPERS ───
 
@@ -31,50 +37,166 @@ def get_expected_categories(store: str) -> set[str]:
     return {cat for cat, brands in MASTER_CATEGORIES.items() if s in brands}
 
 
-def get_actual_categories(test_file_path: str) -> tuple[str, set[str]]:
+def find_store_category_columns(header: list[str], test_file_path: str = '') -> tuple[str, str]:
     """
-    Load CSV/XLS(X) and *only* use header names to find:
+    From header names alone, find:
       - the column containing 'store'
       - the column containing 'cat'
-    Normalize them and return (store_name, set(categories)).
+    Returns (store_col, category_col) as they appear in the file.
     Raises ValueError if headers missing.
     """
-    # 1) Load
-    ext = os.path.splitext(test_file_path)[1].lower()
-    if ext in ('.xls', '.xlsx'):
-        df = pd.read_excel(test_file_path, dtype=str, engine='openpyxl')
-    else:
-        df = pd.read_csv(test_file_path, dtype=str)
-
-    # 2) Build map lowercase_header -> actual_header
-    cols_lower = [c.strip().lower() for c in df.columns]
-    name_to_col = dict(zip(cols_lower, df.columns))
-
-    # 3) Find store column by header name containing 'store'
+    # Build map lowercase_header -> actual_header
+    cols_lower = [str(c).strip().lower() for c in header]
+    name_to_col = dict(zip(cols_lower, header))
+
+    # Find store column by header name containing 'store'
     store_candidates = [orig for lower, orig in name_to_col.items() if 'store' in lower]
     if not store_candidates:
         raise ValueError(f"No column with 'store' in header in {test_file_path}")
-    store_col = store_candidates[0]
 
-    # 4) Find category column by header name containing 'cat'
+    # Find category column by header name containing 'cat'
     cat_candidates = [orig for lower, orig in name_to_col.items() if 'cat' in lower]
     if not cat_candidates:
         raise ValueError(f"No column with 'cat' in header in {test_file_path}")
-    category_col = cat_candidates[0]
 
-    # 5) Subset & normalize
-    subset = df[[store_col, category_col]].copy()
-    subset.columns = ['store', 'category']
-    subset['store']    = subset['store'].astype(str).str.strip().str.lower()
-    subset['category'] = subset['category'].fillna('').astype(str).str.strip().str.lower()
+    return store_candidates[0], cat_candidates[0]
 
-    # 6) Extract
-    store_value = subset['store'].iloc[0]
-    actual_cats = set(subset['category'])
-    actual_cats.discard('')  # drop blanks
 
+def get_actual_categories(test_file_path: str, stop_early: bool = False,
+                          chunksize: int = CHUNK_ROWS) -> tuple[str, set[str]]:
+    """
+    Read the header of a CSV/XLS(X), resolve the store and category columns,
+    then stream *only* those two columns in chunks, collecting the distinct
+    normalized categories as it goes.
+    Returns (store_name, set(categories)); store comes from the first row.
+    With stop_early=True the scan ends as soon as every expected category
+    for the store has been seen (extras further down are then not reported).
+    Raises ValueError if headers missing or the file has no rows.
+    """
+    # 1) Resolve columns from the header row alone
+    store_col, category_col = find_store_category_columns(read_header(test_file_path), test_file_path)
+
+    store_value, expected = None, set()
+    actual_cats = set()
+    usecols = [store_col, category_col]
+    for chunk in iter_table(test_file_path, usecols=usecols,
+                            dtype=schema_dtypes(usecols), chunksize=chunksize):
+        if chunk.empty:
+            continue
+        chunk = chunk[[store_col, category_col]]
+        chunk.columns = ['store', 'category']
+
+        # 2) Store name (normalized) from the very first row
+        if store_value is None:
+            store_value = str(chunk['store'].iloc[0]).strip().lower()
+            expected    = get_expected_categories(store_value)
+
+        # 3) Normalize only the distinct raw categories of this chunk
+        raw = pd.Series(chunk['category'].dropna().unique(), dtype=object).astype(str)
+        actual_cats.update(raw.str.strip().str.lower())
+
+        if stop_early and expected and expected <= actual_cats:
+            break
+
+    if store_value is None:
+        raise ValueError(f"No data rows in {test_file_path}")
+
+    actual_cats.discard('')  # drop blanks
     return store_value, actual_cats
 
+
+def compare_categories(actual: set[str], expected: set[str]) -> str:
+    """Summarize actual vs expected categories as 'all pass' / 'missing: ...' / 'extra: ...'."""
+    if   actual == expected:
+        return 'all pass'
+    elif actual < expected:
+        missing = sorted(expected - actual)
+        return 'missing: ' + ', '.join(missing)
+    elif actual > expected:
+        extra = sorted(actual - expected)
+        return 'extra: ' + ', '.join(extra)
+    return 'category mismatch'
+
+# ─── CATEGORY COLUMN VALIDATION (row level) ───
+
+def infer_store_from_filename(filename: str) -> str:
+    """Pick the MASTER_CATEGORIES store named in the file name (e.g. '25022025_hpe_db_import.csv' -> 'hpe')."""
+    stores = {b for brands in MASTER_CATEGORIES.values() for b in brands}
+    tokens = re.split(r'[^a-z0-9\.]+', os.path.basename(filename).lower())
+    for tok in tokens:
+        if tok in stores:
+            return tok
+    raise ValueError(f"Cannot infer store from filename '{filename}'")
+
+
+def load_category_columns(file_path: str) -> pd.DataFrame:
+    """
+    Read only 'A' and 'category' (headers matched after stripping) as
+    categorical columns: one code per row, one string per distinct value.
+    """
+    header  = read_header(file_path)
+    wanted  = [c for c in header if str(c).strip() in ('A', 'category')]
+    df = load_table(file_path, usecols=wanted, dtype=schema_dtypes(wanted))
+    df.columns = df.columns.str.strip()
+    return df
+
+
+def check_category_frame(df: pd.DataFrame, valid_categories: set[str]) -> dict:
+    """
+    Validate a categorical 'category' column against `valid_categories`.
+    Everything is computed per distinct value from the category codes
+    (stripped; NaN counts as blank), then mapped back to rows once:
+      counts:       Series normalized category -> rows ('' = blank)
+      blank:        number of blank rows
+      invalid:      Series invalid non-blank category -> rows
+      missing:      sorted valid categories that never occur
+      invalid_rows: rows with a blank or invalid category ('A' if present,
+                    'category' stripped), original index kept
+    """
+    col = df['category']
+    if not isinstance(col.dtype, pd.CategoricalDtype):
+        col = col.astype('category')
+    codes = col.cat.codes.to_numpy()
+    norm  = pd.Index(col.cat.categories.astype(str)).str.strip()
+
+    # rows per code; slot 0 holds NaN (code -1)
+    per_code = np.bincount(codes + 1, minlength=len(norm) + 1)
+    counts = pd.Series(per_code[1:], index=norm).groupby(level=0).sum()
+    counts[''] = counts.get('', 0) + per_code[0]
+    counts = counts[counts > 0]
+
+    bad_norm = [c for c in counts.index if c not in valid_categories]
+    blank    = int(counts.get('', 0))
+    invalid  = counts.drop('', errors='ignore').loc[lambda s: ~s.index.isin(valid_categories)]
+
+    # rows: blank (NaN) or a category whose stripped value is not valid
+    bad_code = np.append(norm.isin(bad_norm), True)  # index -1 -> NaN -> blank
+    row_mask = bad_code[codes]
+    row_norm = np.append(norm.to_numpy(dtype=object), '')[codes[row_mask]]
+    invalid_rows = df.loc[row_mask, [c for c in ('A',) if c in df.columns]].copy()
+    invalid_rows['category'] = row_norm
+
+    return {
+        'counts':       counts,
+        'blank':        blank,
+        'invalid':      invalid,
+        'missing':      sorted(set(valid_categories) - set(counts.index)),
+        'invalid_rows': invalid_rows,
+    }
+
+
+def validate_category_file(file_path: str, valid_categories: set[str] | None = None,
+                           store: str | None = None) -> dict:
+    """
+    One pass over one import of any MASTER_CATEGORIES store: load A/category
+    as categoricals and run check_category_frame. Valid categories default to
+    the store's (given, or inferred from the file name).
+    """
+    if valid_categories is None:
+        valid_categories = get_expected_categories(store or infer_store_from_filename(file_path))
+    return check_category_frame(load_category_columns(file_path), valid_categories)
+
+
 def write_report(store: str, result: str):
     """Write a one‐row CSV with store and result."""
     pd.DataFrame([{'store': store, 'result': result}]) \
@@ -86,16 +208,7 @@ def test_categories():
     store, actual = get_actual_categories(TEST_FILE)
     expected     = get_expected_categories(store)
 
-    if   actual == expected:
-        result = 'all pass'
-    elif actual < expected:
-        missing = sorted(expected - actual)
-        result = 'missing: ' + ', '.join(missing)
-    elif actual > expected:
-        extra = sorted(actual - expected)
-        result = 'extra: ' + ', '.join(extra)
-    else:
-        result = 'category mismatch'
+    result       = compare_categories(actual, expected)
 
     write_report(store, result)
     assert actual == expected, result
@@ -1,4 +1,5 @@
 import re
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -9,6 +10,16 @@ import pytest
 #  - hyphens (-)
 VALID_PATTERN = re.compile(r'^[A-Za-z0-9\s-]+$')
 
+FILE_PATH    = "hpe_db_import (1).csv"  # <-- Update with your CSV path
+RESULTS_FILE = "test_results_column_c3.csv"
+
+# Rows per chunk for imports too large to hold in memory; None reads column C in one go
+CHUNKSIZE = None
+
+COMMA_ERROR   = "Comma detected in column C"
+CHARSET_ERROR = ("Contains invalid characters. Only letters, digits, spaces, "
+                 "and (optionally) hyphens are allowed.")
+
 def is_valid_value(value: str) -> bool:
     """Check if the value has only letters, digits, spaces, and hyphens."""
     return bool(VALID_PATTERN.match(value))
@@ -17,13 +28,37 @@ def has_comma(value: str) -> bool:
     """Check if the string contains a comma."""
     return ',' in value
 
+def read_column_c(file_path: str, chunksize: int | None = None):
+    """
+    Read only column C (header matched after stripping spaces).
+    Returns a DataFrame, or an iterator of DataFrames when `chunksize` is set;
+    the row index keeps counting across chunks.
+    """
+    reader = pd.read_csv(file_path, usecols=lambda c: c.strip() == 'C', chunksize=chunksize)
+    if chunksize is None:
+        reader.columns = reader.columns.str.strip()
+        return reader
+    return (chunk.rename(columns=str.strip) for chunk in reader)
+
+def column_c_errors(col: pd.Series) -> pd.DataFrame:
+    """
+    Vectorized column C checks, one error per row (comma takes precedence):
+    returns a frame of row, value, error.
+    """
+    values = col.astype(str).str.strip()
+    comma   = values.str.contains(',', regex=False)
+    invalid = ~values.str.fullmatch(VALID_PATTERN.pattern)
+    bad = comma | invalid
+    return pd.DataFrame({
+        "row":   values.index[bad],
+        "value": values[bad].to_numpy(),
+        "error": np.where(comma[bad], COMMA_ERROR, CHARSET_ERROR),
+    })
+
 @pytest.fixture
-def load_csv():          
-    """Fixture to load the CSV file into a DataFrame."""
-    file_path = "hpe_db_import (1).csv"  # <-- Update with your CSV path
-    df = pd.read_csv(file_path)
-    df.columns = df.columns.str.strip()  # remove extra spaces in column names
-    return df
+def load_csv():
+    """Fixture to load column C of the CSV file (chunk iterator if CHUNKSIZE is set)."""
+    return read_column_c(FILE_PATH, CHUNKSIZE)
 
 def test_column_c_data(load_csv):
     """
@@ -31,39 +66,21 @@ def test_column_c_data(load_csv):
     - Does not contain commas.
     - Includes only letters, digits, spaces, and (optionally) hyphens.
     """
-    df = load_csv
-    assert 'C' in df.columns, "Column 'C' not found in the CSV file."
-
-    errors = []
-
-    for index, row in df.iterrows():
-        raw_value = row['C']
-        # Convert to string and strip leading/trailing whitespace
-        value = str(raw_value).strip()
+    chunks = [load_csv] if isinstance(load_csv, pd.DataFrame) else load_csv
 
-        # 1) Check for commas
-        if has_comma(value):
-            errors.append({
-                "row": index,
-                "value": value,
-                "error": "Comma detected in column C"
-            })
-            continue 
+    error_count = 0
+    for df in chunks:
+        assert 'C' in df.columns, "Column 'C' not found in the CSV file."
 
-        # 2) Check if only letters, digits, spaces, and hyphens
-        if not is_valid_value(value):
-            errors.append({
-                "row": index,
-                "value": value,
-                "error": (
-                    "Contains invalid characters. Only letters, digits, spaces, "
-                    "and (optionally) hyphens are allowed."
-                )
-            })
+        errors = column_c_errors(df['C'])
+        if errors.empty:
+            continue
+        # first batch of errors (re)creates the file, later chunks append
+        errors.to_csv(RESULTS_FILE, mode='w' if error_count == 0 else 'a',
+                      header=error_count == 0, index=False)
+        error_count += len(errors)
 
-    if errors:
-        results_df = pd.DataFrame(errors)
-        results_df.to_csv("test_results_column_c3.csv", index=False)
+    if error_count:
         assert False, (
-            "Validation failed. Details are logged in 'test_results_column_c3.csv'."
+            f"Validation failed. Details are logged in '{RESULTS_FILE}'."
         )
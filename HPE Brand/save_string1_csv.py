@@ -1,6 +1,16 @@
 import pandas as pd
 import pytest
-       
+
+# schema dtypes at the repository root (on the path via pytest.ini)
+from import_schema import schema_dtypes
+
+# Columns to validate
+COLUMNS_TO_TEST = ['store', 'A', 'B']
+RESULTS_FILE    = "test_results_1.csv"
+
+# Also write every valid value to the report (large: one line per input value)
+DUMP_VALID = False
+
 # Validation function
 def is_valid_alphabet(value):
     """
@@ -8,11 +18,26 @@ def is_valid_alphabet(value):
     """
     return isinstance(value, str) and value.isalpha()
 
+def alphabet_mask(col: pd.Series) -> pd.Series:
+    """Vectorized is_valid_alphabet: True where the value is a str of letters only."""
+    if isinstance(col.dtype, pd.CategoricalDtype):
+        # evaluate each distinct value once, then map back through the codes
+        per_value = alphabet_mask(pd.Series(col.cat.categories, dtype=object)).to_numpy()
+        codes = col.cat.codes.to_numpy()
+        return pd.Series((codes >= 0) & per_value[codes], index=col.index)
+    if col.dtype != object and not pd.api.types.is_string_dtype(col):
+        return pd.Series(False, index=col.index)  # numeric column: nothing is a str
+    return col.str.isalpha().eq(True).fillna(False).astype(bool)  # missing / non-str -> False
+
 @pytest.fixture
 def load_csv():
-    """Fixture to load the CSV file into a DataFrame."""
+    """Fixture to load only the tested columns of the CSV file into a DataFrame."""
     file_path = "Memory.net\chunk_1.csv"  # Path to your test CSV file
-    df = pd.read_csv(file_path)
+    wanted = set(COLUMNS_TO_TEST)
+    header = pd.read_csv(file_path, nrows=0).columns
+    usecols = [c for c in header if c.strip() in wanted]
+    dtype = {c: t for c, t in schema_dtypes(usecols).items() if t == 'category'}  # store/A/B as category
+    df = pd.read_csv(file_path, usecols=usecols, dtype=dtype)
     df.columns = df.columns.str.strip()  # Ensure no extra spaces in column names
     return df
 
@@ -20,33 +45,32 @@ def test_alphabet_columns(load_csv):
     """Test and log results for specific columns containing only alphabetic values."""
     df = load_csv
 
-    # Columns to validate
-    columns_to_test = ['store', 'A', 'B']
-
-    # Prepare a list to hold results
-    results = []
+    # Start a fresh report; each column's rows are appended as they are found
+    pd.DataFrame(columns=["column_name", "value_type", "value"]).to_csv(RESULTS_FILE, index=False)
 
-    for column in columns_to_test:
+    invalid_found = False
+    for column in COLUMNS_TO_TEST:
         # Check if the column exists
         assert column in df.columns, f"Column '{column}' not found in the CSV file."
 
-        # Separate valid and invalid rows
-        valid_rows = df[df[column].apply(is_valid_alphabet)]
-        invalid_rows = df[~df[column].apply(is_valid_alphabet)]
-
-        # Collect results for the column
-        for value in valid_rows[column]:
-            results.append({"column_name": column, "value_type": "valid", "value": value})
-
-        for index, row in invalid_rows.iterrows():
-            results.append({"column_name": column, "value_type": "invalid", "value": row[column]})
+        # One mask per column, reused for valid and invalid rows
+        valid = alphabet_mask(df[column])
+        invalid_found |= not valid.all()
 
-    # Convert results into a DataFrame
-    result_df = pd.DataFrame(results)
+        parts = []
+        if DUMP_VALID:
+            parts.append(("valid", df.loc[valid, column]))
+        parts.append(("invalid", df.loc[~valid, column]))
 
-    # Write results to CSV
-    result_df.to_csv("test_results_1.csv", index=False)
+        for value_type, values in parts:
+            if values.empty:
+                continue
+            pd.DataFrame({
+                "column_name": column,
+                "value_type": value_type,
+                "value": values.to_numpy(),
+            }).to_csv(RESULTS_FILE, mode='a', header=False, index=False)
 
     # Always fail the test if invalid rows exist in any column
-    if any(~df[column].apply(is_valid_alphabet).all() for column in columns_to_test):
-        raise AssertionError("Invalid rows found. Details are logged in 'test_results_1.csv'.")
+    if invalid_found:
+        raise AssertionError(f"Invalid rows found. Details are logged in '{RESULTS_FILE}'.")
@@ -1,16 +1,18 @@
 import pytest
-import pandas as pd
+
+# shared category validator at the repository root (on the path via pytest.ini)
+from Common_category_column import get_expected_categories, load_category_columns, check_category_frame
 
 # Allowed category values
-VALID_CATEGORIES = {"adapter", "hba", "hdd", "memory", "optical_drives", "processor", "ssd"}
+VALID_CATEGORIES = get_expected_categories('hpe')
 
 # CSV file paths
 INPUT_CSV_FILE = "25022025_hpe_db_import.csv"  # Update this with your actual CSV file
 INVALID_CATEGORY_CSV = "invalid_category_rows.csv"
 
 def load_csv(file_path):
-    """Load CSV into a DataFrame."""
-    return pd.read_csv(file_path, dtype=str)  # Read as string to detect blanks
+    """Load only 'A' and 'category', as categoricals."""
+    return load_category_columns(file_path)
 
 def test_category_column():
     """Test that the category column has only valid values and no missing data."""
@@ -20,11 +22,8 @@ def test_category_column():
     assert 'category' in df.columns, "Category column is missing in the CSV"
     assert 'A' in df.columns, "Column 'A' is missing in the CSV"  # Ensure column A exists
 
-    # Trim whitespace and fill NaN with empty string for better detection
-    df['category'] = df['category'].str.strip().fillna("")
-
-    # Find invalid rows (not in valid set or empty)
-    invalid_rows = df[~df['category'].isin(VALID_CATEGORIES) | (df['category'] == "")]
+    # Invalid rows (not in valid set or empty), stripped category values
+    invalid_rows = check_category_frame(df, VALID_CATEGORIES)['invalid_rows']
 
     # Save only the 'index', 'A', and 'category' columns to the CSV file
     if not invalid_rows.empty:
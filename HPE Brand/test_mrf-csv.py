@@ -1,23 +1,79 @@
 import pandas as pd
 import re
+import sys
 import pytest
 import os
+from concurrent.futures import ThreadPoolExecutor
+
+# schema dtypes at the repository root (on the path via pytest.ini)
+from import_schema import schema_dtypes
+
+FILE_PATH          = "hpe_db_import (1).csv"  # Path to your test CSV file
+OUTPUT_FILE        = "mfr_part_no_validation_results_one.csv"
+SUFFIX_COUNTS_FILE = "mfr_part_no_suffix_counts.csv"
+
+# 4-6 alphanumerics plus an optional HPE option suffix, captured for statistics
+MFR_PART_NO_RE = re.compile(
+    r'^(?P<base>[a-zA-Z0-9]{4,6})(?P<suffix>-B21|-H21|-K21|-S01|-L22|-S21|-L21|-001|-B22)?$'
+)
+NO_SUFFIX = "(no suffix)"
+INVALID   = "(invalid)"
 
 # Validation function
 def is_valid_mfr_part_no(value):
-    pattern = r'^[a-zA-Z0-9]{4,6}(-B21|-H21|-K21|-S01|-L22|-S21|-L21|-001|-B22)?$'
-    return bool(re.match(pattern, str(value)))
+    return bool(MFR_PART_NO_RE.match(str(value)))
 
-@pytest.fixture
-def load_csv():
-    """Fixture to load the CSV file into a DataFrame."""
-    file_path = "hpe_db_import (1).csv"  # Path to your test CSV file
+def load_mfr_columns(file_path: str) -> pd.DataFrame:
+    """Read only the 'A' and 'mfr_part_no' columns (headers matched after stripping)."""
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"The file '{file_path}' does not exist.")
-    df = pd.read_csv(file_path)
+    header = pd.read_csv(file_path, nrows=0).columns
+    usecols = [c for c in header if c.strip() in ('A', 'mfr_part_no')]
+    dtype = {c: t for c, t in schema_dtypes(usecols).items() if t == 'category'}  # 'A' as category
+    df = pd.read_csv(file_path, usecols=usecols, dtype=dtype)
     df.columns = df.columns.str.strip()  # Ensure no extra spaces in column names
     return df
 
+def validate_mfr_part_no(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    One pass over 'mfr_part_no': str.extract with MFR_PART_NO_RE gives both
+    validity (base matched) and the suffix. Blank cells are not reported,
+    as before. Returns (invalid rows with 'A', per-suffix counts).
+    """
+    values = df['mfr_part_no']
+    parts  = values.astype(str).str.extract(MFR_PART_NO_RE)
+    valid   = parts['base'].notna()
+    invalid = ~valid & values.notna()
+
+    invalid_data = df.loc[invalid, ['A', 'mfr_part_no']].copy()
+    invalid_data['Invalid_mfr_part_no'] = invalid_data['mfr_part_no']
+
+    suffixes = parts.loc[valid, 'suffix'].fillna(NO_SUFFIX)
+    counts = suffixes.value_counts()
+    counts[INVALID] = int(invalid.sum())
+    suffix_counts = counts.rename_axis('suffix').reset_index(name='count')
+    return invalid_data, suffix_counts
+
+def validate_files(paths: list[str], max_workers: int | None = None) -> list[tuple]:
+    """
+    Validate several HPE imports concurrently.
+    Returns (path, invalid_data, suffix_counts, error) per file, in input order;
+    a file that cannot be read gets None frames and the error text.
+    """
+    def run(path):
+        try:
+            return (path, *validate_mfr_part_no(load_mfr_columns(path)), '')
+        except Exception as e:
+            return path, None, None, f"{type(e).__name__}: {e}"
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(run, paths))
+
+@pytest.fixture
+def load_csv():
+    """Fixture to load the needed columns of the CSV file into a DataFrame."""
+    return load_mfr_columns(FILE_PATH)
+
 def test_mfr_part_no_results(load_csv):
     """Test and log results for 'mfr_part_no' column."""
     df = load_csv
@@ -26,18 +82,31 @@ def test_mfr_part_no_results(load_csv):
     assert 'mfr_part_no' in df.columns, "Column 'mfr_part_no' not found in the CSV file."
     assert 'A' in df.columns, "Column 'A' not found in the CSV file."
 
-    # Create Valid and Invalid columns
-    df['Valid_mfr_part_no'] = df['mfr_part_no'].apply(lambda x: x if is_valid_mfr_part_no(x) else None)
-    df['Invalid_mfr_part_no'] = df['mfr_part_no'].apply(lambda x: x if not is_valid_mfr_part_no(x) else None)
-
-    # Filter rows with invalid data and include column 'A'
-    invalid_data = df[df['Invalid_mfr_part_no'].notna()][['A', 'mfr_part_no', 'Invalid_mfr_part_no']]
+    invalid_data, suffix_counts = validate_mfr_part_no(df)
 
-    # Save the updated DataFrame to a new CSV file
-    output_file = "mfr_part_no_validation_results_one.csv"
-    invalid_data.to_csv(output_file, index=False)
-    print(f"Validation results saved to '{output_file}'. Full path: {os.path.abspath(output_file)}")
+    # Save the invalid rows and the per-suffix statistics
+    invalid_data.to_csv(OUTPUT_FILE, index=False)
+    suffix_counts.to_csv(SUFFIX_COUNTS_FILE, index=False)
+    print(f"Validation results saved to '{OUTPUT_FILE}'. Full path: {os.path.abspath(OUTPUT_FILE)}")
 
     # Always fail the test if invalid rows exist
     if not invalid_data.empty:
         raise AssertionError("Invalid mfr_part_no values found. Details saved to the output CSV file.")
+
+if __name__ == "__main__":
+    # Validate several HPE imports at once:
+    #   PYTHONPATH=.. python test_mrf-csv.py a.csv b.csv ...
+    # Combined outputs carry a 'file' column.
+    paths = sys.argv[1:] or [FILE_PATH]
+    invalid_frames, count_frames = [], []
+    for path, invalid_data, suffix_counts, error in validate_files(paths):
+        if error:
+            print(f"{path}: ERROR {error}")
+            continue
+        print(f"{path}: {len(invalid_data)} invalid mfr_part_no value(s)")
+        invalid_frames.append(invalid_data.assign(file=path))
+        count_frames.append(suffix_counts.assign(file=path))
+    if invalid_frames:
+        pd.concat(invalid_frames, ignore_index=True).to_csv(OUTPUT_FILE, index=False)
+        pd.concat(count_frames, ignore_index=True).to_csv(SUFFIX_COUNTS_FILE, index=False)
+        print(f"Results saved to '{OUTPUT_FILE}' and '{SUFFIX_COUNTS_FILE}'")
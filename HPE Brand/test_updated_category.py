@@ -1,17 +1,19 @@
 import pytest
-import pandas as pd
 import os
 
+# shared category validator at the repository root (on the path via pytest.ini)
+from Common_category_column import get_expected_categories, load_category_columns, check_category_frame
+
 # Allowed category values
-VALID_CATEGORIES = {"adapter", "hba", "hdd", "memory", "optical_drives", "processor", "ssd"}
+VALID_CATEGORIES = get_expected_categories('hpe')
 
 # CSV file paths
 INPUT_CSV_FILE = "25022025_hpe_db_import.csv"  # Update this with your actual CSV file
 INVALID_CATEGORY_CSV = "invalid_category_rows_updated1.csv"  # Output CSV file
 
 def load_csv(file_path):
-    """Load CSV into a DataFrame."""
-    return pd.read_csv(file_path, dtype=str)  # Read as string to detect blanks
+    """Load only 'A' and 'category', as categoricals."""
+    return load_category_columns(file_path)
 
 def test_category_column():
     """Test that the category column has only valid values and no missing data."""
@@ -22,16 +24,16 @@ def test_category_column():
 
     # Check if column 'A' exists and print its values if it does
     if 'A' in df.columns:
-        print("Values in column 'A':", df['A'].unique())
+        print("Values in column 'A':", df['A'].cat.categories.tolist())
 
-    # Trim whitespace and fill NaN with empty string for better detection
-    df['category'] = df['category'].str.strip().fillna("")  
+    # Per-category counts (stripped, '' = blank) computed once from the category codes
+    result = check_category_frame(df, VALID_CATEGORIES)
 
     # Print unique categories in the CSV for debugging
-    print("Unique categories found in CSV:", df['category'].unique())
+    print("Unique categories found in CSV:", result['counts'].index.tolist())
 
-    # Find invalid rows (not in valid set or empty)
-    invalid_rows = df[~df['category'].isin(VALID_CATEGORIES) | (df['category'] == "")]
+    # Invalid rows (not in valid set or empty)
+    invalid_rows = result['invalid_rows']
 
     # Check if invalid rows exist before saving
     if not invalid_rows.empty:
@@ -47,8 +49,7 @@ def test_category_column():
         print("No invalid rows found.")
 
     # Check for missing categories
-    present_categories = set(df['category'].unique())
-    missing_categories = VALID_CATEGORIES - present_categories
+    missing_categories = result['missing']
 
     if missing_categories:
         print(f"Warning: Missing categories in the CSV: {', '.join(missing_categories)}")  # Log a warning
@@ -1,9 +1,22 @@
 
+import os
 import re
 import ast
+import pickle
+import hashlib
 import pandas as pd
 import pytest
 
+# shared CSV reader at the repository root (on the path via pytest.ini)
+from ingest import read_csv_fast
+
+# AMD reference chunks and the compiled per-series map persisted from them
+AMD_CHUNK_FILES = [
+    "amd_mapped_with_kingston_extended_processor_chunks/amd_mapped_with_kingston_extended_processor_2.csv",
+]
+AMD_MAP_CACHE = "amd_series_map.pkl"
+AMD_MAP_VERSION = 1  # bump when norm/canonical_token/build_amd_maps change
+
 # ===============================================================
 # Utility Functions
 # ===============================================================
@@ -78,12 +91,14 @@ def contains_match(cand, stack):
     return False
 
 # ===============================================================
-# Fixtures to load data
+# AMD reference maps (compiled once, persisted with a source hash)
 # ===============================================================
-@pytest.fixture(scope="module")
-def amd_df():
-    path = "amd_mapped_with_kingston_extended_processor_chunks/amd_mapped_with_kingston_extended_processor_2.csv"
-    df = pd.read_csv(path, encoding="utf-8-sig", low_memory=False)
+def load_amd_frame(paths):
+    """Load and normalize the AMD reference chunks into (series_norm, amd_norm) rows."""
+    df = pd.concat(
+        [read_csv_fast(p, encoding="utf-8-sig") for p in paths],
+        ignore_index=True,
+    )
 
     # Only AMD rows
     df = df[df["processor"].astype(str).str.contains("AMD", case=False)]
@@ -103,10 +118,82 @@ def amd_df():
 
     return df[["series_norm", "amd_norm"]]
 
+def build_amd_maps(amd_df):
+    """
+    Build the per-series AMD maps:
+      - amd_map:       series -> set of normalized AMD processors
+      - amd_canon_map: series -> set of canonical tokens
+      - amd_display:   series -> {canonical token: original processor} for reporting
+    """
+    exploded = amd_df.explode("amd_norm").dropna(subset=["amd_norm"])
+    exploded = exploded[exploded["series_norm"] != ""].drop_duplicates()
+
+    # canonical_token is only evaluated once per distinct processor string
+    canon = {t: canonical_token(t) for t in exploded["amd_norm"].unique()}
+
+    amd_map, amd_canon_map, amd_display = {}, {}, {}
+    for series, tokens in exploded.groupby("series_norm", sort=False)["amd_norm"]:
+        originals = set(tokens)
+        amd_map[series] = originals
+        amd_canon_map[series] = {canon[t] for t in originals if canon[t]}
+        amd_display[series] = {canon[t]: t for t in sorted(originals)}
+    return amd_map, amd_canon_map, amd_display
+
+def amd_source_hash(paths):
+    """SHA-256 over the map version and the name + bytes of every AMD chunk file."""
+    h = hashlib.sha256(f"v{AMD_MAP_VERSION}".encode())
+    for path in sorted(paths):
+        h.update(os.path.basename(path).encode())
+        with open(path, "rb") as fp:
+            for block in iter(lambda: fp.read(1 << 20), b""):
+                h.update(block)
+    return h.hexdigest()
+
+def compile_amd_maps(paths=AMD_CHUNK_FILES, cache_path=AMD_MAP_CACHE):
+    """Rebuild the AMD maps from the chunk files and persist them with their source hash."""
+    amd_map, amd_canon_map, amd_display = build_amd_maps(load_amd_frame(paths))
+    payload = {
+        "version": AMD_MAP_VERSION,
+        "source_hash": amd_source_hash(paths),
+        "sources": [os.path.basename(p) for p in paths],
+        "amd_map": amd_map,
+        "amd_canon_map": amd_canon_map,
+        "amd_display": amd_display,
+    }
+    tmp_path = cache_path + ".tmp"
+    with open(tmp_path, "wb") as fp:
+        pickle.dump(payload, fp, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, cache_path)
+    return payload
+
+def load_amd_maps(paths=AMD_CHUNK_FILES, cache_path=AMD_MAP_CACHE):
+    """
+    Return the persisted AMD maps, recompiling them only when the cache is
+    missing, was written by another AMD_MAP_VERSION, or the chunk files changed.
+    """
+    if os.path.exists(cache_path):
+        try:
+            with open(cache_path, "rb") as fp:
+                payload = pickle.load(fp)
+            if (payload.get("version") == AMD_MAP_VERSION
+                    and payload.get("source_hash") == amd_source_hash(paths)):
+                return payload
+        except Exception:
+            pass  # unreadable / stale artifact -> rebuild below
+    return compile_amd_maps(paths, cache_path)
+
+# ===============================================================
+# Fixtures to load data
+# ===============================================================
+@pytest.fixture(scope="module")
+def amd_maps():
+    return load_amd_maps()
+
 @pytest.fixture(scope="module")
 def kingston_df():
     path = "kingston_mapped_with_all_intel_products_chunks/kingston_mapped_with_all_intel_products_1.csv"
-    df = pd.read_csv(path, encoding="utf-8-sig", low_memory=False)
+    df = read_csv_fast(path, encoding="utf-8-sig",
+                       usecols=["processor_series", "final_processor_data"])
 
     # Keep raw columns for reporting
     df["processor_series"] = df["processor_series"].astype(str)
@@ -140,19 +227,14 @@ def kingston_df():
 def test_amd_vs_kingston(request):
 
     # --- Fetch fixtures inside the test to prevent giant dumps in failure headers ---
-    amd_df = request.getfixturevalue("amd_df")
+    amd_maps = request.getfixturevalue("amd_maps")
     kingston_df = request.getfixturevalue("kingston_df")
 
     # ---------------------------
-    # Build AMD maps (original + canonical) per series
+    # AMD maps (canonical + display) per series, loaded from the compiled artifact
     # ---------------------------
-    amd_map = {}
-    amd_canon_map = {}
-    for _, r in amd_df.iterrows():
-        key = r["series_norm"]
-        if key:
-            amd_map.setdefault(key, set()).update(r["amd_norm"])
-            amd_canon_map.setdefault(key, set()).update(to_canonical_set(r["amd_norm"]))
+    amd_canon_map = amd_maps["amd_canon_map"]
+    amd_display = amd_maps["amd_display"]
 
     # ---------------------------
     # Missing processors per-row in Kingston (canonical fuzzy matching)
@@ -163,8 +245,7 @@ def test_amd_vs_kingston(request):
 
         ks_canon_row = to_canonical_set(r["ks_norm"])
         amd_canon_for_series = amd_canon_map.get(series, set())
-        amd_orig_for_series = sorted(amd_map.get(series, set()))
-        canon_to_amd_orig = {canonical_token(a): a for a in amd_orig_for_series}
+        canon_to_amd_orig = amd_display.get(series, {})
 
         missing_canon = []
         for a_c in sorted(amd_canon_for_series):
@@ -233,4 +314,11 @@ def test_amd_vs_kingston(request):
         print("Examples:")
         for row in rows_with_dupes[:5]:
             print(f"  Row {row['row_id']} | Series: {row['series_norm']} | Duplicates: {row['duplicates']}")
-        assert False  # stop the test cleanly
\ No newline at end of file
+        assert False  # stop the test cleanly
+
+if __name__ == "__main__":
+    # Compile step: refresh the persisted AMD map after the chunk files change
+    #   PYTHONPATH=.. python Kingston_AMd_mapping.py
+    payload = compile_amd_maps()
+    print(f"Compiled {len(payload['amd_map'])} AMD series into '{AMD_MAP_CACHE}' "
+          f"(source hash {payload['source_hash'][:12]})")
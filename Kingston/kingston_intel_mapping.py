@@ -1,12 +1,17 @@
 import os
 import re
 import ast
+import glob
 import time
 import warnings
 import pytest
+import numpy as np
 import pandas as pd
 from functools import lru_cache
 
+# shared CSV reader at the repository root (on the path via pytest.ini)
+from ingest import read_csv_fast
+
 warnings.filterwarnings('ignore', category=FutureWarning)
 
 try:
@@ -16,6 +21,32 @@ try:
 except Exception:
     USE_SWIFTER = False
     print("Swifter not available")
+
+try:
+    from rapidfuzz import fuzz, process
+    HAS_RAPIDFUZZ = True
+except ImportError:
+    HAS_RAPIDFUZZ = False
+
+# Optional fuzzy pairing of leftover Intel-missing x Kingston-extra processors
+# per chipset: 'greedy' (best score first) or 'optimal' (needs scipy)
+FUZZY_PAIRING = False
+FUZZY_PAIR_CUTOFF = 90
+FUZZY_ASSIGNMENT = "greedy"
+
+# Kingston mapping file(s); a glob such as "kingston_mapped_with_all_intel_products_*.csv"
+# runs the comparison over every chunk file
+KINGSTON_FILE = "kingston_mapped_with_all_intel_products_1.csv"
+
+# Kingston per-chipset aggregation: 'pandas' (the loaded frame) or 'dask'
+# (aggregate_kingston_files: reads KINGSTON_FILE in DASK_BLOCKSIZE partitions
+# on the local multiprocessing scheduler). Only aggregate_kingston_files used
+# on its own keeps memory bounded: the test's per-row checks need the
+# kingston_df fixture, which holds every row anyway, so there 'dask' only
+# moves the aggregation onto worker processes.
+AGGREGATION_BACKEND = "pandas"
+DASK_BLOCKSIZE = "64MB"
+DASK_SCHEDULER = "processes"
    
 # --------------------
 # Normalization helpers
@@ -68,6 +99,114 @@ def merge_processors_unique(series_of_lists):
                 merged.append(p)
     return merged
 
+class GroupIndex:
+    """
+    Rows of a frame grouped by one key column without per-group copies:
+    one stable sort (keys in groupby order, rows in file order within a key)
+    and a (start, stop) offset per key into the reordered column arrays.
+    Missing keys are dropped, like groupby(dropna=True).
+    """
+
+    def __init__(self, df: pd.DataFrame, key: str, columns: list):
+        codes, uniques = pd.factorize(df[key], sort=True)
+        order = np.argsort(codes, kind='stable')
+        order = order[codes[order] >= 0]
+        counts = np.bincount(codes[order], minlength=len(uniques))
+        stops = np.cumsum(counts)
+        starts = stops - counts
+
+        self.keys = list(uniques)
+        self.columns = {c: df[c].to_numpy()[order] for c in columns}
+        self._offsets = dict(zip(self.keys, zip(starts.tolist(), stops.tolist())))
+
+    def __contains__(self, key) -> bool:
+        return key in self._offsets
+
+    def size(self, key) -> int:
+        start, stop = self._offsets.get(key, (0, 0))
+        return stop - start
+
+    def values(self, column: str, key) -> np.ndarray:
+        """`column` values of the rows with `key` (a view; empty if the key is absent)."""
+        start, stop = self._offsets.get(key, (0, 0))
+        return self.columns[column][start:stop]
+
+def aggregate_kingston_processors(kingston_df: pd.DataFrame, index: GroupIndex = None) -> pd.DataFrame:
+    """
+    Union of unique processors per Kingston chipset -> chipset_normalized_k, processor_agg.
+    Reuses `index` (a GroupIndex on chipset_normalized) when given.
+    """
+    index = index or GroupIndex(kingston_df, 'chipset_normalized', ['final_processor_data'])
+    agg = pd.Series(
+        [merge_processors_unique(index.values('final_processor_data', k)) for k in index.keys],
+        index=pd.Index(index.keys, name='chipset_normalized'), name='final_processor_data', dtype=object,
+    )
+    return _aggregated_frame(agg)
+
+def _aggregated_frame(agg: pd.Series) -> pd.DataFrame:
+    return (
+        agg.reset_index()
+           .rename(columns={'chipset_normalized': 'chipset_normalized_k', agg.name: 'processor_agg'})
+    )
+
+# dask aggregation: each row becomes ((row order, list position, normalized name, original), ...)
+# for its processors; partial results keep the earliest entry per normalized name, so the
+# final list is merge_processors_unique's first-seen union without shuffling whole rows.
+
+def _first_seen(entries) -> tuple:
+    best = {}
+    for entry in entries:
+        name = entry[2]
+        if name not in best or entry < best[name]:
+            best[name] = entry
+    return tuple(best.values())
+
+def _first_seen_union(groups) -> pd.Series:
+    # non-tuple values only occur in the placeholder rows dask infers metadata from
+    return groups.apply(lambda s: _first_seen(e for entries in s if isinstance(entries, tuple) for e in entries))
+
+def _first_seen_list(entries) -> list:
+    return [e[3] for e in sorted(entries)]
+
+def _row_entries(part: pd.DataFrame, partition_info=None) -> pd.DataFrame:
+    """Prepared Kingston rows of one partition -> chipset_normalized, processor entries."""
+    part = prepare_kingston_rows(part, use_swifter=False)
+    number = partition_info['number'] if partition_info else 0
+    entries = []
+    for pos, plist in enumerate(part['final_processor_data']):
+        row, seen = [], set()
+        for i, p in enumerate(plist if isinstance(plist, list) else []):
+            n = normalize_processor_name(p)
+            if n and n not in seen:
+                seen.add(n)
+                row.append(((number, pos), i, n, p))
+        entries.append(tuple(row))
+    return pd.DataFrame({'chipset_normalized': part['chipset_normalized'].to_numpy(),
+                         'entries': pd.Series(entries, dtype=object).to_numpy()})
+
+def aggregate_kingston_files(pattern: str = None) -> pd.DataFrame:
+    """
+    aggregate_kingston_processors straight from the Kingston CSV file(s) with dask:
+    rows are read and prepared per partition and reduced with a tree
+    aggregation, so only per-chipset results are ever held in memory.
+    """
+    import dask
+    import dask.dataframe as dd
+
+    union = dd.Aggregation('first_seen_union', chunk=_first_seen_union, agg=_first_seen_union,
+                           finalize=lambda s: s.map(_first_seen_list))
+    meta = pd.DataFrame({'chipset_normalized': pd.Series(dtype=object), 'entries': pd.Series(dtype=object)})
+    with dask.config.set({'dataframe.convert-string': False}):  # keep object chipsets, like pandas
+        rows = dd.read_csv(kingston_paths(pattern or KINGSTON_FILE), dtype=str, blocksize=DASK_BLOCKSIZE)
+        entries = rows.map_partitions(_row_entries, meta=meta)
+        agg = (
+            entries.groupby('chipset_normalized').agg({'entries': union})['entries']
+                   .compute(scheduler=DASK_SCHEDULER)
+                   .sort_index()
+                   .rename('final_processor_data')
+        )
+    return _aggregated_frame(agg)
+
 def compute_unmatched_both_sides(intel_procs, kingston_procs):
     inorm = [normalize_processor_name(p) for p in intel_procs if isinstance(p, str) and p.strip()]
     knorm = [normalize_processor_name(p) for p in kingston_procs if isinstance(p, str) and p.strip()]
@@ -85,6 +224,67 @@ def compute_unmatched_both_sides(intel_procs, kingston_procs):
 
     return backmap(intel_missing_norm, intel_procs), backmap(kingston_extra_norm, kingston_procs)
 
+_FUZZY_NOISE_RE = re.compile(r'\((?:r|tm)\)|\b(?:processors?|cpu)\b')
+# whole model token with letter prefix / suffix: 6230r, 10400f, 4210t, g6400
+_MODEL_TOKEN_RE = re.compile(r'\b[a-z]?\d{3,5}[a-z0-9]*\b')
+
+@lru_cache(maxsize=10000)
+def fuzzy_processor_key(name: str) -> str:
+    """normalize_processor_name minus (R)/(TM) marks and 'Processor'/'CPU' words, for scoring."""
+    s = _FUZZY_NOISE_RE.sub(' ', normalize_processor_name(name))
+    return ' '.join(s.split())
+
+def _assign_pairs(scores: np.ndarray, cutoff: float, method: str) -> list:
+    """(row, col) pairs of `scores` at or above `cutoff`, each row/col used once."""
+    if method == 'optimal':
+        try:
+            from scipy.optimize import linear_sum_assignment
+        except ImportError:
+            method = 'greedy'
+            print("scipy not installed - using greedy fuzzy assignment")
+        else:
+            rows, cols = linear_sum_assignment(scores, maximize=True)
+            return [(r, c) for r, c in zip(rows, cols) if scores[r, c] >= cutoff]
+
+    rows, cols = np.nonzero(scores >= cutoff)
+    order = np.argsort(-scores[rows, cols], kind='stable')  # best first, ties in (row, col) order
+    used_r, used_c, pairs = set(), set(), []
+    for r, c in zip(rows[order], cols[order]):
+        if r not in used_r and c not in used_c:
+            used_r.add(r)
+            used_c.add(c)
+            pairs.append((r, c))
+    return sorted(pairs)
+
+def pair_unmatched_fuzzy(intel_missing, kingston_extra, cutoff=None, method=None):
+    """
+    Pair leftover Intel-missing and Kingston-extra processors whose fuzzy keys
+    score >= cutoff (one batched rapidfuzz cdist per chipset).
+    Returns (pairs [(intel, kingston, score)], still missing, still extra).
+    """
+    cutoff = FUZZY_PAIR_CUTOFF if cutoff is None else cutoff
+    if not HAS_RAPIDFUZZ or not intel_missing or not kingston_extra:
+        return [], list(intel_missing), list(kingston_extra)
+
+    ikeys = [fuzzy_processor_key(p) for p in intel_missing]
+    kkeys = [fuzzy_processor_key(p) for p in kingston_extra]
+    scores = process.cdist(ikeys, kkeys, scorer=fuzz.token_sort_ratio, score_cutoff=cutoff, workers=-1)
+
+    # E-2234 vs E-2236 (~94) or Gold 6230 vs 6230R (~98) are different SKUs:
+    # only pair names whose model tokens are identical
+    models = {}
+    imodel = np.array([models.setdefault(tuple(_MODEL_TOKEN_RE.findall(k)), len(models)) for k in ikeys])
+    kmodel = np.array([models.setdefault(tuple(_MODEL_TOKEN_RE.findall(k)), len(models)) for k in kkeys])
+    scores[imodel[:, None] != kmodel[None, :]] = 0
+    pairs = _assign_pairs(scores, cutoff, method or FUZZY_ASSIGNMENT)
+    paired_i = {r for r, _ in pairs}
+    paired_k = {c for _, c in pairs}
+    return (
+        [(intel_missing[r], kingston_extra[c], round(float(scores[r, c]), 1)) for r, c in pairs],
+        [p for i, p in enumerate(intel_missing) if i not in paired_i],
+        [p for i, p in enumerate(kingston_extra) if i not in paired_k],
+    )
+
 # Helper: detect server description column name from Kingston file (case-insensitive)
 
 def detect_server_description_col(df: pd.DataFrame):
@@ -108,7 +308,7 @@ def intel_df():
     if not os.path.exists(intel_file):
         pytest.fail(f" Intel file not found: {intel_file}")
 
-    df = pd.read_csv(intel_file, low_memory=False)
+    df = read_csv_fast(intel_file)
     assert 'chipset' in df.columns and 'product_name' in df.columns, \
         "Intel CSV must contain 'chipset' and 'product_name'"
 
@@ -123,13 +323,66 @@ def intel_df():
     )
     return grouped
 
+def parse_chipset(val):
+    s = str(val).strip()
+    if s.startswith('[') and s.endswith(']'):
+        try:
+            parsed = ast.literal_eval(s)
+            if isinstance(parsed, list) and parsed:
+                return parsed[0]
+        except Exception:
+            pass
+    return s
+
+def safe_eval(val):
+    if pd.isna(val):
+        return []
+    if isinstance(val, list):
+        return val
+    if isinstance(val, str):
+        s = val.strip()
+        if s == "":
+            return []
+        if s.startswith('[') and s.endswith(']'):
+            try:
+                return ast.literal_eval(s)
+            except Exception:
+                return [s]
+        if s.startswith('(') and s.endswith(')'):
+            try:
+                tup = ast.literal_eval(s)
+                return list(tup) if isinstance(tup, tuple) else [s]
+            except Exception:
+                return [s]
+        return [s]
+    return [str(val)]
+
+def prepare_kingston_rows(df: pd.DataFrame, use_swifter: bool = USE_SWIFTER) -> pd.DataFrame:
+    """Drop rows without a chipset, parse chipset / processor lists, add chipset_normalized."""
+    df = df[df['chipset'].notna()]
+    df = df[df['chipset'].astype(str).str.strip() != ""]
+
+    df['chipset'] = df['chipset'].swifter.apply(parse_chipset) if use_swifter else df['chipset'].apply(parse_chipset)
+    df = df[df['chipset'].notna()]
+    df['chipset'] = df['chipset'].astype(str).str.strip().str.lower()
+
+    df['final_processor_data'] = df['final_processor_data'].swifter.apply(safe_eval) if use_swifter else df['final_processor_data'].apply(safe_eval)
+
+    df['chipset_normalized'] = df['chipset'].apply(normalize_chipset_name)
+    return df
+
+def kingston_paths(pattern: str) -> list:
+    """KINGSTON_FILE or a glob of chunk files -> sorted existing paths."""
+    return sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern]
+
 @pytest.fixture(scope="module")
 def kingston_df():
-    kingston_file = "kingston_mapped_with_all_intel_products_1.csv"
-    if not os.path.exists(kingston_file):
-        pytest.fail(f" Kingston file not found: {kingston_file}")
+    kingston_files = [p for p in kingston_paths(KINGSTON_FILE) if os.path.exists(p)]
+    if not kingston_files:
+        pytest.fail(f" Kingston file not found: {KINGSTON_FILE}")
 
-    df = pd.read_csv(kingston_file, low_memory=False)
+    df = pd.concat([read_csv_fast(p) for p in kingston_files], ignore_index=True) \
+        if len(kingston_files) > 1 else read_csv_fast(kingston_files[0])
     assert 'chipset' in df.columns and 'final_processor_data' in df.columns, \
         "Kingston CSV must contain those columns memtioned"
 
@@ -137,51 +390,8 @@ def kingston_df():
     server_desc_col = detect_server_description_col(df)
     df.attrs['server_desc_col'] = server_desc_col  # stash for later
 
-    df = df[df['chipset'].notna()]
-    df = df[df['chipset'].astype(str).str.strip() != ""]
-
-    def parse_chipset(val):
-        s = str(val).strip()
-        if s.startswith('[') and s.endswith(']'):
-            try:
-                parsed = ast.literal_eval(s)
-                if isinstance(parsed, list) and parsed:
-                    return parsed[0]
-            except Exception:
-                pass
-        return s
-
-    df['chipset'] = df['chipset'].swifter.apply(parse_chipset) if USE_SWIFTER else df['chipset'].apply(parse_chipset)
-    df = df[df['chipset'].notna()]
-    df['chipset'] = df['chipset'].astype(str).str.strip().str.lower()
-
-    def safe_eval(val):
-        if pd.isna(val):
-            return []
-        if isinstance(val, list):
-            return val
-        if isinstance(val, str):
-            s = val.strip()
-            if s == "":
-                return []
-            if s.startswith('[') and s.endswith(']'):
-                try:
-                    return ast.literal_eval(s)
-                except Exception:
-                    return [s]
-            if s.startswith('(') and s.endswith(')'):
-                try:
-                    tup = ast.literal_eval(s)
-                    return list(tup) if isinstance(tup, tuple) else [s]
-                except Exception:
-                    return [s]
-            return [s]
-        return [str(val)]
-
-    df['final_processor_data'] = df['final_processor_data'].swifter.apply(safe_eval) if USE_SWIFTER else df['final_processor_data'].apply(safe_eval)
-
+    df = prepare_kingston_rows(df)
     df = df.reset_index().rename(columns={'index': 'kingston_row_index'})
-    df['chipset_normalized'] = df['chipset'].apply(normalize_chipset_name)
     return df
 
 # --------------------
@@ -215,12 +425,13 @@ def test_compare_intel_and_kingston(intel_df, kingston_df):
         pytest.fail(" No Intel rows mapped")
 
     # Aggregate Kingston processors per chipset (UNION unique)
-    kingston_grouped = (
-        kingston_df.groupby('chipset_normalized', dropna=True)['final_processor_data']
-                   .apply(merge_processors_unique)
-                   .reset_index()
-                   .rename(columns={'chipset_normalized': 'chipset_normalized_k', 'final_processor_data': 'processor_agg'})
-    )
+    # Kingston rows by chipset: sorted once, shared by the aggregation and the per-row loop
+    k_index = GroupIndex(kingston_df, 'chipset_normalized', ['kingston_row_index', 'final_processor_data'])
+    if AGGREGATION_BACKEND == 'dask':
+        # re-reads the files; kingston_df is already in memory for the per-row loop below
+        kingston_grouped = aggregate_kingston_files(KINGSTON_FILE)
+    else:
+        kingston_grouped = aggregate_kingston_processors(kingston_df, index=k_index)
 
     merged = pd.merge(
         intel_df_mapped,
@@ -236,9 +447,6 @@ def test_compare_intel_and_kingston(intel_df, kingston_df):
     per_row_missing_records = []   # will later be merged with all-rows duplicate info + server desc
     result_rows = []
 
-    # Convenience grouping: Kingston rows by chipset
-    k_rows_by_chipset = {k: g for k, g in kingston_df.groupby('chipset_normalized', dropna=True)}
-
     # Precompute duplicates for ALL Kingston rows (independent of mapping)
     dup_all_rows = []
     for _, kr in kingston_df.iterrows():
@@ -263,6 +471,9 @@ def test_compare_intel_and_kingston(intel_df, kingston_df):
     # Determine server description column name
     server_desc_col = kingston_df.attrs.get('server_desc_col', None)
 
+    if FUZZY_PAIRING and not HAS_RAPIDFUZZ:
+        print("rapidfuzz not installed - skipping fuzzy processor pairing")
+
     for _, row in merged.iterrows():
         chipset_intel_raw = row['chipset']
         chipset_norm_key = row['chipset_mapped']
@@ -271,10 +482,13 @@ def test_compare_intel_and_kingston(intel_df, kingston_df):
 
         # Aggregated subset comparison
         intel_missing_list_agg, kingston_extra_list_agg = compute_unmatched_both_sides(intel_procs, kingston_procs_agg)
+        fuzzy_pairs = []
+        if FUZZY_PAIRING:
+            fuzzy_pairs, intel_missing_list_agg, kingston_extra_list_agg = pair_unmatched_fuzzy(
+                intel_missing_list_agg, kingston_extra_list_agg)
 
         # Per-row checks (missing + duplicates per-row) for MAPPED chipsets
-        krows = k_rows_by_chipset.get(chipset_norm_key, pd.DataFrame())
-        rows_total = len(krows)
+        rows_total = k_index.size(chipset_norm_key)
         rows_all_empty = 0
         rows_with_missing = 0
         rows_with_duplicates = 0
@@ -284,7 +498,7 @@ def test_compare_intel_and_kingston(intel_df, kingston_df):
 
         per_row_duplicate_accum = []
 
-        if rows_total == 0:
+        if chipset_norm_key not in k_index:
             per_row_missing_records.append({
                 'chipset_intel': chipset_intel_raw,
                 'chipset_normalized': chipset_norm_key,
@@ -294,8 +508,10 @@ def test_compare_intel_and_kingston(intel_df, kingston_df):
                 'missing_intel_processors': str([backmap[n] for n in sorted(list(i_norm_set))])
             })
         else:
-            for _, krow in krows.iterrows():
-                plist = krow['final_processor_data'] if isinstance(krow['final_processor_data'], list) else []
+            k_row_indexes = k_index.values('kingston_row_index', chipset_norm_key)
+            k_plists = k_index.values('final_processor_data', chipset_norm_key)
+            for k_row_index, plist in zip(k_row_indexes, k_plists):
+                plist = plist if isinstance(plist, list) else []
 
                 # per-row duplicates (for mapped set roll-up)
                 seen, row_dups = set(), []
@@ -324,7 +540,7 @@ def test_compare_intel_and_kingston(intel_df, kingston_df):
                 per_row_missing_records.append({
                     'chipset_intel': chipset_intel_raw,
                     'chipset_normalized': chipset_norm_key,
-                    'kingston_row_index': int(krow['kingston_row_index']) if 'kingston_row_index' in krow else None,
+                    'kingston_row_index': int(k_row_index),
                     'kingston_row_has_data': len(plist) > 0,
                     'missing_count': len(missing_norm),
                     'missing_intel_processors': str(missing_originals)
@@ -341,7 +557,7 @@ def test_compare_intel_and_kingston(intel_df, kingston_df):
             rows_with_duplicates > 0
         )
 
-        result_rows.append({
+        result_row = {
             'chipset_intel': chipset_intel_raw,
             'chipset_kingston': chipset_norm_key,
             'chipset_normalized': chipset_norm_key,
@@ -363,7 +579,11 @@ def test_compare_intel_and_kingston(intel_df, kingston_df):
             'rows_with_duplicates': int(rows_with_duplicates),
             'per_row_duplicate_count': len(per_row_duplicate_accum),
             'per_row_duplicate_list': str(per_row_duplicate_accum),
-        })
+        }
+        if FUZZY_PAIRING:
+            result_row['fuzzy_matched_count'] = len(fuzzy_pairs)
+            result_row['fuzzy_matched_pairs'] = str(fuzzy_pairs)
+        result_rows.append(result_row)
 
     # Build DataFrames
     result_df = pd.DataFrame(result_rows)
@@ -414,4 +634,5 @@ def test_compare_intel_and_kingston(intel_df, kingston_df):
 
 # Runner (optional)
 if __name__ == '__main__':
+    # PYTHONPATH=.. python kingston_intel_mapping.py (or: pytest kingston_intel_mapping.py)
     pytest.main([__file__, '-v', '-s', '--tb=short'])
@@ -0,0 +1,61 @@
+import sys
+
+import numpy as np
+import pytest
+
+pytest.importorskip("rapidfuzz")
+
+import kingston_intel_mapping as kim  # noqa: E402
+from kingston_intel_mapping import _assign_pairs, pair_unmatched_fuzzy  # noqa: E402
+
+# (Intel missing, Kingston extra): different SKUs that score above the cutoff
+NEAR_MISSES = [
+    ("Intel Xeon Gold 6230", "Intel Xeon Gold 6230R"),
+    ("Intel Xeon E-2234", "Intel Xeon E-2236"),
+    ("Intel Core i5-10400", "Intel Core i5-10400F"),
+    ("Intel Xeon Silver 4210", "Intel Xeon Silver 4210T"),
+]
+
+# greedy takes (0, 0) first and leaves row 1 unpaired; optimal pairs both rows
+SCORES = np.array([[100.0, 95.0],
+                   [95.0, 0.0]])
+
+
+@pytest.mark.parametrize("intel, kingston", NEAR_MISSES)
+def test_different_models_are_not_paired(intel, kingston):
+    pairs, missing, extra = pair_unmatched_fuzzy([intel], [kingston])
+    assert pairs == []
+    assert missing == [intel]
+    assert extra == [kingston]
+
+
+def test_spelling_differences_are_paired():
+    intel = ["Intel(R) Xeon(R) Gold 6230 Processor", "Intel Xeon E-2234"]
+    kingston = ["intel xeon e-2234 cpu", "Intel Xeon Gold 6230"]
+    pairs, missing, extra = pair_unmatched_fuzzy(intel, kingston)
+    assert [(i, k) for i, k, _ in pairs] == [(intel[0], kingston[1]), (intel[1], kingston[0])]
+    assert all(score >= kim.FUZZY_PAIR_CUTOFF for _, _, score in pairs)
+    assert missing == [] and extra == []
+
+
+def test_greedy_assignment():
+    assert _assign_pairs(SCORES, 90, 'greedy') == [(0, 0)]
+
+
+def test_optimal_assignment():
+    pytest.importorskip("scipy")
+    assert sorted(_assign_pairs(SCORES, 90, 'optimal')) == [(0, 1), (1, 0)]
+
+
+def test_optimal_without_scipy_falls_back_to_greedy(monkeypatch, capsys):
+    monkeypatch.setitem(sys.modules, "scipy.optimize", None)  # import raises ImportError
+    assert _assign_pairs(SCORES, 90, 'optimal') == [(0, 0)]
+    assert "scipy not installed" in capsys.readouterr().out
+
+
+def test_without_rapidfuzz_nothing_is_paired(monkeypatch):
+    monkeypatch.setattr(kim, "HAS_RAPIDFUZZ", False)
+    pairs, missing, extra = pair_unmatched_fuzzy(["Intel Xeon E-2234"], ["intel xeon e-2234"])
+    assert pairs == []
+    assert missing == ["Intel Xeon E-2234"]
+    assert extra == ["intel xeon e-2234"]
@@ -1,14 +1,59 @@
 import os
 import re
+import glob
 from typing import List, Tuple
+import numpy as np
 import pandas as pd
 
+from ingest import read_csv_fast
+from processor_keys import key_set
+
+try:
+    from rapidfuzz import fuzz, process, utils as fuzz_utils
+    HAS_RAPIDFUZZ = True
+except ImportError:
+    HAS_RAPIDFUZZ = False
+
 # -------------------------
 # FILE CONFIGURATION - UPDATE THESE PATHS
 # -------------------------
 SOURCE_CSV = "acer_mapping_servers_only.csv"    # Your source file
 OUTPUT_CSV = "validation_results.csv"           # Output file name  
 DESTINATION_CSV = "acer_servers_only.csv"       # Your destination file
+# SOURCE_CSV / DESTINATION_CSV may also be globs, e.g. "acer_*_chunks/*.csv"
+
+# -------------------------
+# Execution backend
+#  'pandas': everything in memory (default for small inputs)
+#  'dask':   partitioned graphs on the local multiprocessing scheduler
+#  'auto':   dask once the inputs reach DASK_MIN_BYTES (and dask is installed)
+# -------------------------
+EXECUTION_BACKEND = "auto"
+DASK_MIN_BYTES = 512 * 1024 * 1024
+DASK_BLOCKSIZE = "64MB"          # bytes of CSV per partition
+DASK_SCHEDULER = "processes"
+
+# -------------------------
+# Processor model keys
+#  Processor lists that still differ after slash expansion are compared on
+#  structured keys (processor_keys.py): same vendor/family/generation/model/
+#  suffix passes, e.g. "Intel(R) Core(TM) i5-12400F Processor" vs
+#  "Intel Core i5 12400F". Off by default (exact-string verdicts) until the
+#  key match has been checked against real imports.
+# -------------------------
+MATCH_ON_MODEL_KEYS = False
+
+# -------------------------
+# Fuzzy reconciliation of NO_MATCH rows (needs rapidfuzz)
+#  Rows whose exact (option_part_no, server_description, chipset) merge failed
+#  are compared against destination rows with the same option_part_no and
+#  chipset; the best server_description above FUZZY_MIN_SCORE is used.
+#  Model tokens (dl380, gen10, sr650, r740xd) must be equal on both sides,
+#  so only case, spacing, punctuation and plain words may differ.
+# -------------------------
+FUZZY_RECONCILE = False
+FUZZY_MIN_SCORE = 90             # 0-100, rapidfuzz token_sort_ratio
+FUZZY_PARALLEL_MIN = 10_000      # pairs in a block before cdist uses all cores
 
 # -------------------------
 # Config & constants
@@ -178,25 +223,68 @@ def _final_clean(df: pd.DataFrame) -> pd.DataFrame:
         )
     return df
 
+# -------------------------
+# Execution backend
+# -------------------------
+
+def _dask_available() -> bool:
+    try:
+        import dask.dataframe  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def _input_paths(pattern: str) -> List[str]:
+    """A single CSV path or a glob (e.g. 'acer_chunks/*.csv') -> sorted existing files."""
+    return sorted(glob.glob(pattern)) if glob.has_magic(pattern) else ([pattern] if os.path.exists(pattern) else [])
+
+
+def choose_backend(*patterns: str) -> str:
+    """Resolve EXECUTION_BACKEND; 'auto' picks dask only for inputs of DASK_MIN_BYTES or more."""
+    if EXECUTION_BACKEND != 'auto':
+        return EXECUTION_BACKEND
+    total = sum(os.path.getsize(p) for pat in patterns if pat for p in _input_paths(pat))
+    return 'dask' if total >= DASK_MIN_BYTES and _dask_available() else 'pandas'
+
+
+# Both backends read every column as text, so 'auto' gives the same output
+# whichever it picks: per-block dtype inference disagrees across dask
+# partitions, and an inferred float column turns part number 678 into "678.0".
+
+def _read_csvs(pattern: str) -> pd.DataFrame:
+    paths = _input_paths(pattern)
+    if len(paths) == 1:
+        return read_csv_fast(paths[0], dtype=str)
+    return pd.concat([read_csv_fast(p, dtype=str) for p in paths], ignore_index=True)
+
+
+def _read_csvs_dask(pattern: str):
+    import dask.dataframe as dd
+    return dd.read_csv(_input_paths(pattern), dtype=str, blocksize=DASK_BLOCKSIZE)
+
 # -------------------------
 # Main processing functions
 # -------------------------
 
-def process_source_csv(source_csv: str) -> pd.DataFrame:
-    """Process the source CSV file and return cleaned/split data"""
-    print(f"Reading source CSV: {source_csv}")
-    src = pd.read_csv(source_csv)
+GROUP_COLS = ['option_part_no', 'server_description', 'chipset']
+
+
+def _prepare_source(src: pd.DataFrame, verbose: bool = True) -> pd.DataFrame:
+    """Row-local part of process_source_csv: filter, explode, split and clean processors."""
     src = _std_colnames(src)
 
     # Ensure processor column exists
     if 'processor' not in src.columns:
         raise ValueError("Source CSV must have a 'processor' column")
 
-    print(f"Initial rows: {len(src)}")
+    if verbose:
+        print(f"Initial rows: {len(src)}")
     
     # Filter to only processors of interest
-    src = src[src['processor'].apply(_contains_interest)]
-    print(f"Rows after filtering for processors of interest: {len(src)}")
+    src = src[src['processor'].apply(_contains_interest).astype(bool)]
+    if verbose:
+        print(f"Rows after filtering for processors of interest: {len(src)}")
 
     # Prepare processor text and explode quoted splits
     src['processor'] = src['processor'].astype(str).str.replace("(N/A)", "", regex=False).str.strip()
@@ -207,6 +295,8 @@ def process_source_csv(source_csv: str) -> pd.DataFrame:
 
     # Split into processor and chipset components
     split_df = src['processor'].apply(split_processor_chipset)
+    if src.empty:  # apply() on no rows gives no columns to split into
+        split_df = pd.DataFrame({'processor': [], 'chipset': []}, index=src.index, dtype=object)
     src['processor_split'] = split_df['processor']
     
     # Only update chipset if it doesn't exist or is empty - FIXED LOGIC
@@ -214,7 +304,7 @@ def process_source_csv(source_csv: str) -> pd.DataFrame:
         src['chipset'] = split_df['chipset']
     else:
         # Only fill empty chipset values, preserve existing ones
-        mask = src['chipset'].fillna('').astype(str).apply(lambda x: not _has_meaningful_chipset(x))
+        mask = src['chipset'].fillna('').astype(str).apply(lambda x: not _has_meaningful_chipset(x)).astype(bool)
         src.loc[mask, 'chipset'] = split_df.loc[mask, 'chipset']
 
     # Normalize and expand processors
@@ -228,14 +318,31 @@ def process_source_csv(source_csv: str) -> pd.DataFrame:
     src = _final_clean(src)
 
     # Group by key columns and aggregate processors
-    group_cols = ['option_part_no', 'server_description', 'chipset']
-    for c in group_cols:
+    for c in GROUP_COLS:
         if c not in src.columns:
             src[c] = ''
-    
+    return src
+
+
+def _processor_set(values) -> frozenset:
+    return frozenset(_clean_text(v) for v in values if _clean_text(v))
+
+
+def process_source_csv(source_csv: str, backend: str = None) -> pd.DataFrame:
+    """
+    Process the source CSV file(s) and return cleaned/split data.
+    `source_csv` may be a glob; backend 'dask' runs it as a partitioned graph.
+    """
+    backend = backend or choose_backend(source_csv)
+    print(f"Reading source CSV: {source_csv} ({backend})")
+    if backend == 'dask':
+        return _process_source_dask(source_csv)
+
+    src = _prepare_source(_read_csvs(source_csv))
     grouped = (
-        src.groupby(group_cols, as_index=False)
-           .agg({'processor': lambda x: ', '.join(sorted(set(_clean_text(v) for v in x if _clean_text(v))))})
+        src.groupby(GROUP_COLS, as_index=False)
+           .agg({'processor': lambda x: ', '.join(sorted(_processor_set(x)))})
+           .sort_values(GROUP_COLS, kind='stable', ignore_index=True)  # same order as the dask backend
            .drop_duplicates()
     )
     
@@ -243,137 +350,195 @@ def process_source_csv(source_csv: str) -> pd.DataFrame:
     return grouped
 
 
-def compare_with_destination(processed_source: pd.DataFrame, dest_csv: str = None) -> pd.DataFrame:
-    """Compare processed source with destination CSV if provided - IMPROVED matching with FIXED chipset validation"""
-    if dest_csv and os.path.exists(dest_csv):
-        print(f"Reading destination CSV: {dest_csv}")
-        dest = pd.read_csv(dest_csv)
-        dest = _std_colnames(dest)
-        
-        # Handle common typo in column name
-        if 'all_amd_processsor' in dest.columns and 'all_amd_processor' not in dest.columns:  
-            dest = dest.rename(columns={'all_amd_processsor': 'all_amd_processor'})
+def _process_source_dask(source_csv: str) -> pd.DataFrame:
+    """process_source_csv as a dask graph: row-local prep per partition, tree-reduced set union per group."""
+    import dask.dataframe as dd
+
+    src = _read_csvs_dask(source_csv)
+    meta = _prepare_source(src._meta.copy(), verbose=False)[GROUP_COLS + ['processor']]
+    prepared = src.map_partitions(
+        lambda part: _prepare_source(part, verbose=False)[GROUP_COLS + ['processor']], meta=meta,
+    )
+
+    union = dd.Aggregation(
+        'processor_union',
+        chunk=lambda s: s.apply(_processor_set),
+        agg=lambda s: s.apply(lambda sets: frozenset().union(*sets)),
+        finalize=lambda s: s.apply(lambda st: ', '.join(sorted(st))),
+    )
+    grouped = (
+        prepared.groupby(GROUP_COLS).agg({'processor': union})
+                .compute(scheduler=DASK_SCHEDULER)
+                .reset_index()
+                .sort_values(GROUP_COLS, kind='stable', ignore_index=True)
+                .drop_duplicates()
+    )
+    print(f"Final grouped rows: {len(grouped)}")
+    return grouped
+
+
+def _expand_slashes(src_procs) -> set:
+    """Slash-delimited source entries -> individual processors ("intel core i5 12400/12500" -> two)."""
+    src_expanded = set()
+    for proc in src_procs:
+        if '/' in proc:
+            # Handle slash-delimited format like "intel core i5 12400/12500"
+            parts = proc.split('/')
+            if len(parts) == 2:
+                base = parts[0].strip()
+                suffix = parts[1].strip()
+                # Find common prefix
+                base_words = base.split()
+                if len(base_words) >= 3:  # e.g. "intel core i5"
+                    prefix = ' '.join(base_words[:-1])
+                    src_expanded.add(base.lower())
+                    src_expanded.add(f"{prefix} {suffix}".lower())
+                else:
+                    src_expanded.add(proc.lower())
+            else:
+                # More than 2 parts, split all
+                base_parts = proc.split('/')
+                if len(base_parts[0].split()) >= 3:
+                    prefix = ' '.join(base_parts[0].split()[:-1])
+                    for part in base_parts:
+                        if part == base_parts[0]:
+                            src_expanded.add(part.lower())
+                        else:
+                            src_expanded.add(f"{prefix} {part}".lower())
+                else:
+                    src_expanded.add(proc.lower())
+        else:
+            src_expanded.add(proc.lower())
+    return src_expanded
+
+
+def _same_model_keys(src_proc: str, dst_proc: str) -> bool:
+    """Both lists parse completely and give the same set of processor keys."""
+    src_keys = key_set(src_proc)
+    return src_keys is not None and src_keys == key_set(dst_proc)
+
+
+# FIXED validation logic - only check chipset if source has meaningful chipset data
+def validate_row(row) -> Tuple[str, str]:
+    """(test_result, reason) for one merged source/destination row (Series or dict)."""
+    src_proc = row.get('processor_src_norm', '').strip()
+    dst_proc = row.get('all_amd_processor_norm', '').strip()
+    src_chip = row.get('chipset', '').strip()  # Source chipset
+    reasons = []
+    
+    # Check if destination row exists (from merge)
+    if pd.isna(row.get('all_amd_processor')):
+        return 'NO_MATCH', 'No matching row found in destination'
+    
+    # FIXED: Only check for missing chipset if source actually has chipset data
+    if _has_meaningful_chipset(src_chip):
+        # Source has chipset data, so we should validate it exists in destination
+        # Note: chipset is already part of merge key, so if we matched, chipsets should align
+        pass  # Chipset validation is handled by the merge logic
+    
+    # Always check for processor data
+    if not dst_proc:
+        reasons.append('Missing all_amd_processor in destination')
         
-        # Clean destination data BEFORE merging
-        for col in ['chipset', 'all_amd_processor']:
-            if col not in dest.columns:
-                dest[col] = ''
+    # Smart processor comparison that handles format differences
+    if src_proc and dst_proc:
+        # Normalize both to sets of individual processors for comparison
+        src_procs = set(p.strip().lower() for p in src_proc.split(','))
+        dst_procs = set(p.strip().lower() for p in dst_proc.split(','))
         
-        dest['chipset'] = dest['chipset'].fillna('').astype(str).apply(_clean_text)
-        dest['all_amd_processor'] = dest['all_amd_processor'].fillna('').astype(str).apply(_clean_text)
+        if src_procs == dst_procs:
+            return 'PASS', ''
+        else:
+            # Check if it's just a format difference (slash vs comma)
+            src_expanded = _expand_slashes(src_procs)
+            
+            # Compare expanded source with destination
+            if src_expanded == dst_procs:
+                return 'PASS', 'Matched after slash expansion'
+            elif MATCH_ON_MODEL_KEYS and _same_model_keys(src_proc, dst_proc):
+                return 'PASS', 'Matched on processor model keys'
+            else:
+                # Still different - this is a real mismatch
+                missing_in_dst = src_expanded - dst_procs
+                extra_in_dst = dst_procs - src_expanded
+                details = []
+                if missing_in_dst:
+                    details.append(f"Missing in dest: {', '.join(sorted(missing_in_dst))}")
+                if extra_in_dst:
+                    details.append(f"Extra in dest: {', '.join(sorted(extra_in_dst))}")
+                reasons.append(f'Processor content mismatch: {"; ".join(details)}')
+                
+    if not reasons and not src_proc and not dst_proc:
+        return 'PASS', 'Both empty'
         
-        # Ensure merge keys exist and are clean
-        key_cols = ['option_part_no', 'server_description', 'chipset']
-        for c in key_cols:
-            if c not in dest.columns:
-                dest[c] = ''
-            if c not in processed_source.columns:
-                processed_source[c] = ''
-            # Clean merge keys
-            dest[c] = dest[c].fillna('').astype(str).apply(_clean_text)
-            processed_source[c] = processed_source[c].fillna('').astype(str).apply(_clean_text)
+    return ('FAIL' if reasons else 'PASS', '; '.join(reasons))
+
+
+def _prepare_dest(dest: pd.DataFrame) -> pd.DataFrame:
+    """Standardize and clean the destination columns used for matching."""
+    dest = _std_colnames(dest)
+    
+    # Handle common typo in column name
+    if 'all_amd_processsor' in dest.columns and 'all_amd_processor' not in dest.columns:  
+        dest = dest.rename(columns={'all_amd_processsor': 'all_amd_processor'})
+    
+    # Clean destination data BEFORE merging
+    for col in ['chipset', 'all_amd_processor']:
+        if col not in dest.columns:
+            dest[col] = ''
+    
+    dest['chipset'] = dest['chipset'].fillna('').astype(str).apply(_clean_text)
+    dest['all_amd_processor'] = dest['all_amd_processor'].fillna('').astype(str).apply(_clean_text)
+    return _clean_keys(dest)
+
+
+def _clean_keys(df: pd.DataFrame) -> pd.DataFrame:
+    """Ensure merge keys exist and are clean"""
+    for c in GROUP_COLS:
+        if c not in df.columns:
+            df[c] = ''
+        df[c] = df[c].fillna('').astype(str).apply(_clean_text)
+    return df
+
+
+def _validate_merged(merged: pd.DataFrame) -> pd.DataFrame:
+    """Normalize both processor lists and add test_result / reason per merged row."""
+    merged = merged.rename(columns={'processor': 'processor_src'})
+
+    # Ensure we use the correctly processed data for normalization
+    merged['processor_src_norm'] = merged['processor_src'].fillna('').apply(_norm_list_string)
+    merged['all_amd_processor_norm'] = merged['all_amd_processor'].fillna('').apply(_norm_list_string)
+
+    results = [validate_row(r) for r in merged.to_dict('records')]
+    merged['test_result'] = [r[0] for r in results]
+    merged['reason'] = [r[1] for r in results]
+    return merged
+
+
+def compare_with_destination(processed_source: pd.DataFrame, dest_csv: str = None,
+                             backend: str = None) -> pd.DataFrame:
+    """Compare processed source with destination CSV if provided - IMPROVED matching with FIXED chipset validation"""
+    if dest_csv and _input_paths(dest_csv):
+        backend = backend or choose_backend(dest_csv)
+        print(f"Reading destination CSV: {dest_csv} ({backend})")
+        processed_source = _clean_keys(processed_source)
+        if backend == 'dask':
+            return _compare_dask(processed_source, dest_csv)
+
+        dest = _prepare_dest(_read_csvs(dest_csv))
         
         # Debug: Print merge key info
         print(f"Source rows: {len(processed_source)}")
         print(f"Destination rows: {len(dest)}")
         
         # Merge and compare
-        merged = processed_source.merge(dest, on=key_cols, how='left', suffixes=('_src', '_dest'))
-        merged = merged.rename(columns={'processor': 'processor_src'})
+        merged = processed_source.merge(dest, on=GROUP_COLS, how='left', suffixes=('_src', '_dest'))
         
         print(f"Merged rows: {len(merged)}")
         print(f"Rows with destination data: {len(merged.dropna(subset=['all_amd_processor']))}")
         
-        # Ensure we use the correctly processed data for normalization
-        merged['processor_src_norm'] = merged['processor_src'].fillna('').apply(_norm_list_string)
-        merged['all_amd_processor_norm'] = merged['all_amd_processor'].fillna('').apply(_norm_list_string)
-
-        # FIXED validation logic - only check chipset if source has meaningful chipset data
-        def validate_row(row):
-            src_proc = row.get('processor_src_norm', '').strip()
-            dst_proc = row.get('all_amd_processor_norm', '').strip()
-            src_chip = row.get('chipset', '').strip()  # Source chipset
-            reasons = []
-            
-            # Check if destination row exists (from merge)
-            if pd.isna(row.get('all_amd_processor')):
-                return 'NO_MATCH', 'No matching row found in destination'
-            
-            # FIXED: Only check for missing chipset if source actually has chipset data
-            if _has_meaningful_chipset(src_chip):
-                # Source has chipset data, so we should validate it exists in destination
-                # Note: chipset is already part of merge key, so if we matched, chipsets should align
-                pass  # Chipset validation is handled by the merge logic
-            
-            # Always check for processor data
-            if not dst_proc:
-                reasons.append('Missing all_amd_processor in destination')
-                
-            # Smart processor comparison that handles format differences
-            if src_proc and dst_proc:
-                # Normalize both to sets of individual processors for comparison
-                src_procs = set(p.strip().lower() for p in src_proc.split(','))
-                dst_procs = set(p.strip().lower() for p in dst_proc.split(','))
-                
-                if src_procs == dst_procs:
-                    return 'PASS', ''
-                else:
-                    # Check if it's just a format difference (slash vs comma)
-                    # Convert source format: "Intel Core i5 12400/12500" -> {"intel core i5 12400", "intel core i5 12500"}
-                    src_expanded = set()
-                    for proc in src_procs:
-                        if '/' in proc:
-                            # Handle slash-delimited format like "intel core i5 12400/12500"
-                            parts = proc.split('/')
-                            if len(parts) == 2:
-                                base = parts[0].strip()
-                                suffix = parts[1].strip()
-                                # Find common prefix
-                                base_words = base.split()
-                                if len(base_words) >= 3:  # e.g. "intel core i5"
-                                    prefix = ' '.join(base_words[:-1])
-                                    src_expanded.add(base.lower())
-                                    src_expanded.add(f"{prefix} {suffix}".lower())
-                                else:
-                                    src_expanded.add(proc.lower())
-                            else:
-                                # More than 2 parts, split all
-                                base_parts = proc.split('/')
-                                if len(base_parts[0].split()) >= 3:
-                                    prefix = ' '.join(base_parts[0].split()[:-1])
-                                    for part in base_parts:
-                                        if part == base_parts[0]:
-                                            src_expanded.add(part.lower())
-                                        else:
-                                            src_expanded.add(f"{prefix} {part}".lower())
-                                else:
-                                    src_expanded.add(proc.lower())
-                        else:
-                            src_expanded.add(proc.lower())
-                    
-                    # Compare expanded source with destination
-                    if src_expanded == dst_procs:
-                        return 'PASS', 'Matched after slash expansion'
-                    else:
-                        # Still different - this is a real mismatch
-                        missing_in_dst = src_expanded - dst_procs
-                        extra_in_dst = dst_procs - src_expanded
-                        details = []
-                        if missing_in_dst:
-                            details.append(f"Missing in dest: {', '.join(sorted(missing_in_dst))}")
-                        if extra_in_dst:
-                            details.append(f"Extra in dest: {', '.join(sorted(extra_in_dst))}")
-                        reasons.append(f'Processor content mismatch: {"; ".join(details)}')
-                        
-            if not reasons and not src_proc and not dst_proc:
-                return 'PASS', 'Both empty'
-                
-            return ('FAIL' if reasons else 'PASS', '; '.join(reasons))
-
-        validation_results = merged.apply(lambda r: pd.Series(validate_row(r)), axis=1)
-        merged[['test_result', 'reason']] = validation_results
-        
-        return merged
+        results = _validate_merged(merged)
+        return reconcile_no_match(results, dest) if FUZZY_RECONCILE else results
     else:
         # No destination file, just return processed source with additional columns for consistency
         processed_source['test_result'] = 'NO_COMPARISON'
@@ -381,11 +546,110 @@ def compare_with_destination(processed_source: pd.DataFrame, dest_csv: str = Non
         processed_source['processor_src_norm'] = processed_source['processor'].apply(_norm_list_string)
         return processed_source
 
+
+def _compare_dask(processed_source: pd.DataFrame, dest_csv: str) -> pd.DataFrame:
+    """compare_with_destination with the destination as a partitioned dask frame."""
+    import dask.dataframe as dd
+
+    dest_raw = _read_csvs_dask(dest_csv)
+    dest = dest_raw.map_partitions(_prepare_dest, meta=_prepare_dest(dest_raw._meta.copy()))
+
+    # keep the source order through the shuffle join
+    source = processed_source.assign(_src_order=range(len(processed_source)))
+    nparts = max(1, dest.npartitions)
+    merged = dd.from_pandas(source, npartitions=nparts).merge(
+        dest, on=GROUP_COLS, how='left', suffixes=('_src', '_dest'))
+    merged = merged.map_partitions(_validate_merged)
+
+    result = (merged.compute(scheduler=DASK_SCHEDULER)
+                    .sort_values('_src_order', kind='stable')
+                    .drop(columns='_src_order')
+                    .reset_index(drop=True))
+    print(f"Source rows: {len(processed_source)}")
+    print(f"Merged rows: {len(result)}")
+    if FUZZY_RECONCILE:
+        # only destination rows sharing a part number can be candidates
+        parts = set(result.loc[result['test_result'].eq('NO_MATCH'), 'option_part_no'])
+        candidates = dest[dest['option_part_no'].isin(parts)].compute(scheduler=DASK_SCHEDULER)
+        result = reconcile_no_match(result, candidates)
+    return result
+
+
+_MODEL_TOKEN_RE = re.compile(r'[a-z]*\d+[a-z]*')
+
+
+def server_model_tokens(description: str) -> tuple:
+    """Sorted alphanumeric model tokens of a server description ("ProLiant DL380 Gen10" -> ('dl380', 'gen10'))."""
+    return tuple(sorted(_MODEL_TOKEN_RE.findall(fuzz_utils.default_process(description))))
+
+
+def reconcile_no_match(results: pd.DataFrame, dest: pd.DataFrame,
+                       min_score: float = FUZZY_MIN_SCORE) -> pd.DataFrame:
+    """
+    Second pass for NO_MATCH rows: within each (option_part_no, chipset) block,
+    score source vs destination server_description with one rapidfuzz cdist and
+    validate against the best destination row scoring at least `min_score`
+    whose server_model_tokens equal the source's (DL380 never matches DL360).
+    Matched rows get fuzzy_server_description / fuzzy_score and a PASS/FAIL.
+    """
+    if not HAS_RAPIDFUZZ:
+        print("rapidfuzz not installed - skipping fuzzy reconciliation")
+        return results
+
+    results = results.copy()
+    results['all_amd_processor'] = results['all_amd_processor'].astype(object)  # all-NaN when nothing merged
+    results['fuzzy_server_description'] = ''
+    results['fuzzy_score'] = np.nan
+    pending = results[results['test_result'].eq('NO_MATCH')]
+    if pending.empty or dest.empty:
+        return results
+
+    block_cols = ['option_part_no', 'chipset']
+    dest = dest.reset_index(drop=True)
+    dest_blocks = dest.groupby(block_cols, sort=False).indices
+    dest_desc = dest['server_description'].to_numpy()
+    dest_proc = dest['all_amd_processor'].to_numpy()
+
+    matched = 0
+    for key, labels in pending.groupby(block_cols, sort=False).groups.items():
+        positions = dest_blocks.get(key)
+        if positions is None:
+            continue
+        queries = results.loc[labels, 'server_description'].tolist()
+        choices = dest_desc[positions].tolist()
+        workers = -1 if len(queries) * len(choices) >= FUZZY_PARALLEL_MIN else 1
+        scores = process.cdist(queries, choices, scorer=fuzz.token_sort_ratio,
+                               processor=fuzz_utils.default_process,
+                               score_cutoff=min_score, workers=workers)
+        # different model numbers score 93-95 ("DL380 Gen10" vs "DL360 Gen10"): never a match
+        tokens = {}
+        q_ids = np.array([tokens.setdefault(server_model_tokens(q), len(tokens)) for q in queries])
+        c_ids = np.array([tokens.setdefault(server_model_tokens(c), len(tokens)) for c in choices])
+        scores[q_ids[:, None] != c_ids[None, :]] = 0
+        best = scores.argmax(axis=1)
+        best_scores = scores[np.arange(len(queries)), best]
+        for label, b, score in zip(labels, best, best_scores):
+            if score < min_score or score == 0:
+                continue
+            d = positions[b]
+            results.at[label, 'all_amd_processor'] = dest_proc[d]
+            results.at[label, 'all_amd_processor_norm'] = _norm_list_string(dest_proc[d])
+            results.at[label, 'fuzzy_server_description'] = dest_desc[d]
+            results.at[label, 'fuzzy_score'] = float(score)
+            status, reason = validate_row(results.loc[label])
+            note = f"Fuzzy server_description match ({score:.0f}): '{dest_desc[d]}'"
+            results.at[label, 'test_result'] = status
+            results.at[label, 'reason'] = f"{note}; {reason}" if reason else note
+            matched += 1
+
+    print(f"Fuzzy-reconciled NO_MATCH rows: {matched} of {len(pending)}")
+    return results
+
 def process_and_validate_csv(source_csv: str, output_csv: str, dest_csv: str = None): 
     """Main function to process source CSV and generate output"""
     
     try:
-        if not os.path.exists(source_csv):
+        if not _input_paths(source_csv):
             raise FileNotFoundError(f"Source CSV file not found: {source_csv}")
         
         # Process source CSV
@@ -404,6 +668,8 @@ def process_and_validate_csv(source_csv: str, output_csv: str, dest_csv: str = N
         if 'all_amd_processor' in results.columns:
             output_columns.insert(-2, 'all_amd_processor')
             output_columns.insert(-2, 'all_amd_processor_norm')
+        if 'fuzzy_score' in results.columns:
+            output_columns += ['fuzzy_server_description', 'fuzzy_score']
         
         # Ensure all columns exist
         for col in output_columns:
@@ -414,7 +680,7 @@ def process_and_validate_csv(source_csv: str, output_csv: str, dest_csv: str = N
         results[output_columns].to_csv(output_csv, index=False)
         
         # Print detailed summary
-        if dest_csv and os.path.exists(dest_csv):
+        if dest_csv and _input_paths(dest_csv):
             failed = int((results['test_result'] == 'FAIL').sum())
             passed = int((results['test_result'] == 'PASS').sum())
             no_match = int((results['test_result'] == 'NO_MATCH').sum())
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+audit_imports.py
+
+Batch audit of brand import files (CSV / XLS / XLSX).
+
+For every file matched by the given directories / globs it runs:
+ 1. the required-columns check of test_verify_clms.py (MASTER_RULES),
+    from the header row only;
+ 2. the store/category check of Common_category_column.py
+    (MASTER_CATEGORIES), reading only the 'store' and 'cat' columns.
+
+Files are found and audited with the directory scanner of test_verify_clms.py,
+in a thread pool (or a process pool with --processes).
+A file that cannot be read is recorded with its error and the run goes on.
+All results go to one consolidated report, with per-file timing.
+
+Usage:
+    python audit_imports.py <dir or glob> [<dir or glob> ...]
+        [--out import_audit_report.csv] [--workers N] [--processes]
+"""
+
+import os
+import sys
+import time
+import argparse
+import pandas as pd
+
+from test_verify_clms import probe_schema, columns_result, import_files, probe_files
+from Common_category_column import get_actual_categories, get_expected_categories, compare_categories
+
+# ─── CONFIG ───
+REPORT_FILE = 'import_audit_report.csv'
+
+REPORT_COLUMNS = [
+    'file', 'brand', 'store', 'columns_result', 'categories_result',
+    'status', 'error', 'seconds',
+]
+
+
+# ─── HELPERS ───
+
+def collect_files(targets: list[str]) -> list[str]:
+    """Expand directories and glob patterns into a sorted, de-duplicated list of import files."""
+    files = set()
+    for target in targets:
+        files.update(import_files(os.path.join(target, '*') if os.path.isdir(target) else target))
+    return sorted(files)
+
+
+def audit_file(path: str) -> dict:
+    """Run both checks on one file; never raises."""
+    started = time.perf_counter()
+    errors = []
+    row = {'file': path, 'brand': '', 'store': '', 'columns_result': '', 'categories_result': ''}
+
+    # 1) required columns, header only
+    probe = probe_schema(path)
+    row['brand'] = probe['brand']
+    if probe['error']:
+        errors.append(f"columns: {probe['error']}")
+    else:
+        row['columns_result'] = columns_result(probe['missing'], probe['extra'])
+
+    # 2) store / category, two columns only
+    try:
+        store, actual = get_actual_categories(path)
+        row['store'] = store
+        row['categories_result'] = compare_categories(actual, get_expected_categories(store))
+    except Exception as e:
+        errors.append(f"categories: {type(e).__name__}: {e}")
+
+    passed = (not errors
+              and row['columns_result'] == 'all pass'
+              and row['categories_result'] == 'all pass')
+    row['status'] = 'PASS' if passed else ('ERROR' if errors else 'FAIL')
+    row['error'] = '; '.join(errors)
+    row['seconds'] = round(time.perf_counter() - started, 3)
+    return row
+
+
+def audit_files(files: list[str], max_workers: int | None = None, processes: bool = False) -> pd.DataFrame:
+    """Audit every file concurrently and return the consolidated report (input order)."""
+    rows = probe_files(files, audit_file, max_workers, processes)
+    return pd.DataFrame(rows, columns=REPORT_COLUMNS)
+
+
+# ─── MAIN ───
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Audit brand import files against MASTER_RULES and MASTER_CATEGORIES.")
+    parser.add_argument('targets', nargs='+', help="directories or glob patterns of import files")
+    parser.add_argument('--out', default=REPORT_FILE, help=f"consolidated report (default: {REPORT_FILE})")
+    parser.add_argument('--workers', type=int, default=None, help="pool size (default: executor default)")
+    parser.add_argument('--processes', action='store_true', help="use a process pool instead of threads")
+    args = parser.parse_args(argv)
+
+    files = collect_files(args.targets)
+    if not files:
+        print("ERROR: No CSV/XLS/XLSX files matched")
+        return 1
+
+    started = time.perf_counter()
+    report = audit_files(files, args.workers, args.processes)
+    report.to_csv(args.out, index=False)
+
+    counts = report['status'].value_counts()
+    print(f"Audited {len(files)} file(s) in {time.perf_counter() - started:.2f}s: "
+          f"{int(counts.get('PASS', 0))} pass, {int(counts.get('FAIL', 0))} fail, "
+          f"{int(counts.get('ERROR', 0))} error")
+    print(f"Report written to: {args.out}")
+    return 0 if counts.get('PASS', 0) == len(files) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+bench_ingest.py
+
+Compare CSV read paths on real imports:
+  c_engine : pd.read_csv(path, low_memory=False)   (current scripts)
+  arrow    : ingest.read_csv_fast(path)            (multithreaded Arrow)
+  arrow_pa : ingest.read_csv_fast(path, arrow_dtypes=True)
+
+Each path is timed REPEAT times (best run reported). The plain Arrow frame is
+also compared to the C-engine frame so a speedup never hides a behaviour change.
+Before timing, a small built-in sample with the known edge cases (all-blank
+column, NA strings, dates, mixed text) is read both ways and must match.
+
+Usage:
+    python bench_ingest.py <csv> [<csv> ...] [--repeat 3]
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+import pandas as pd
+
+from ingest import HAS_PYARROW, read_csv_fast
+
+READERS = {
+    "c_engine": lambda p: pd.read_csv(p, low_memory=False),
+    "arrow":    lambda p: read_csv_fast(p),
+    "arrow_pa": lambda p: read_csv_fast(p, arrow_dtypes=True),
+}
+
+
+# Edge cases Arrow and read_csv have disagreed on; "blank" has no values at all
+PARITY_SAMPLE = (
+    "part,qty,speed,blank,shipped,note\n"
+    "A1,1,3200,,2024-01-05,ok\n"
+    "B2,,2933.5,,2024-02-10,N/A\n"
+    "C3,4,,,,text, quoted\n"
+)
+
+
+def best_time(fn, path, repeat):
+    best, df = float("inf"), None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        df = fn(path)
+        best = min(best, time.perf_counter() - started)
+    return best, df
+
+
+def same_frame(a: pd.DataFrame, b: pd.DataFrame) -> bool:
+    """Equal up to float rounding (the C engine's default float parser is not round-trip exact)."""
+    try:
+        pd.testing.assert_frame_equal(a, b)
+    except AssertionError:
+        return False
+    return True
+
+
+def parity_check() -> list[str]:
+    """Read PARITY_SAMPLE with both engines (inferred and dtype=str); names of the cases that differ."""
+    with tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False) as fp:
+        fp.write(PARITY_SAMPLE.replace("text, quoted", '"text, quoted"'))
+    try:
+        cases = {
+            "inferred": ({}, {}),
+            "dtype=str": ({"dtype": str}, {"dtype": str}),
+        }
+        return [name for name, (pd_kw, fast_kw) in cases.items()
+                if not same_frame(pd.read_csv(fp.name, **pd_kw), read_csv_fast(fp.name, **fast_kw))]
+    finally:
+        os.remove(fp.name)
+
+
+def bench_file(path: str, repeat: int = 3) -> dict:
+    row = {"file": os.path.basename(path), "mb": round(os.path.getsize(path) / 1e6, 1)}
+    frames = {}
+    for name, fn in READERS.items():
+        row[f"{name}_s"], frames[name] = best_time(fn, path, repeat)
+        row[f"{name}_mem_mb"] = round(frames[name].memory_usage(deep=True).sum() / 1e6, 1)
+    row["rows"] = len(frames["c_engine"])
+    row["speedup"] = round(row["c_engine_s"] / row["arrow_s"], 2)
+    row["same_as_c_engine"] = same_frame(frames["c_engine"], frames["arrow"])
+    return row
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the C-engine and Arrow CSV readers.")
+    parser.add_argument("paths", nargs="+", help="CSV files (largest imports)")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    if not HAS_PYARROW:
+        print("pyarrow is not installed: read_csv_fast falls back to the C engine")
+    mismatched = parity_check()
+    if mismatched:
+        print(f"read_csv_fast differs from pd.read_csv on the parity sample: {', '.join(mismatched)}")
+        return 1
+    report = pd.DataFrame([bench_file(p, args.repeat) for p in args.paths])
+    with pd.option_context("display.width", 200, "display.max_columns", None):
+        print(report.to_string(index=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,272 @@
+"""
+brand_grouping.py
+
+Streaming "distinct values per brand" grouping for list.py and kingston_list.py.
+
+group_distinct(path, key_column, value_column) reads only the two columns,
+in chunks and as text, and keeps per-key distinct values in first-seen order
+(what drop_duplicates + groupby(...).apply(list) gives). When more than
+MAX_PAIRS_IN_MEMORY distinct (key, value) pairs are held, they are spilled to
+NUM_PARTITIONS pickle files partitioned by a hash of the key; at the end each
+partition is merged on its own, so memory is bounded by the largest partition
+rather than by the whole file. Results come back sorted by key, like groupby.
+
+apply_import(store_path, path, ...) keeps those groups in a small pickle
+store between runs so a new dated import is applied on its own:
+ - mode "merge":   the file's rows are added to the stored groups (append),
+                   so brands can only gain values; the report lists gains;
+ - mode "replace": the file is today's full snapshot and replaces them; the
+                   report lists gained and lost values per brand.
+Either way it returns the updated groups and that report against the
+previous run, without re-reading older imports. An import is recognised by
+a hash of its bytes, so a corrected file under the same name is applied.
+"""
+
+import os
+import zlib
+import hashlib
+import pickle
+import shutil
+import tempfile
+import datetime
+import pandas as pd
+
+CHUNK_ROWS = 200_000            # rows read per chunk
+MAX_PAIRS_IN_MEMORY = 2_000_000  # distinct (key, value) pairs held before spilling
+NUM_PARTITIONS = 16
+GROUP_STORE_VERSION = 1
+STORE_MODES = ("merge", "replace")
+CHANGES_COLUMNS = ["brand", "gained_count", "lost_count", "gained", "lost"]
+MERGE_CHANGES_COLUMNS = ["brand", "gained_count", "gained"]  # merge mode never loses values
+
+
+def _partition(key) -> int:
+    # crc32 rather than hash(): stable across runs, no PYTHONHASHSEED surprises
+    return zlib.crc32(str(key).encode("utf-8")) % NUM_PARTITIONS
+
+
+def _resolve_column(header: list[str], column) -> str:
+    """Accept a header name or a 0-based position."""
+    if isinstance(column, int):
+        return header[column]
+    if column not in header:
+        raise KeyError(f"Column '{column}' not found in the data.")
+    return column
+
+
+class _SpillStore:
+    """Per-key first-seen distinct values, spilled to hash partitions when too large."""
+
+    def __init__(self, max_pairs: int, spill_dir: str | None):
+        self.max_pairs = max_pairs
+        self.spill_dir = spill_dir
+        self.groups = {}      # key -> {value: first row number}
+        self.pairs = 0
+        self.spilled = False
+        self._tmp = None
+
+    def add(self, keys: pd.Series, values: pd.Series, start_row: int):
+        # first row of each distinct (key, value) pair in the chunk, then only those go through Python
+        pairs = pd.DataFrame({"key": keys, "value": values}).reset_index(drop=True).drop_duplicates(keep="first")
+        groups = self.groups
+        for row, key, value in zip((pairs.index + start_row).tolist(), pairs["key"].tolist(), pairs["value"].tolist()):
+            seen = groups.setdefault(key, {})
+            if value not in seen:
+                seen[value] = row
+                self.pairs += 1
+        if self.pairs > self.max_pairs:
+            self.spill()
+
+    def _partition_path(self, part: int) -> str:
+        if self._tmp is None:
+            self._tmp = tempfile.mkdtemp(prefix="brand_grouping_", dir=self.spill_dir)
+        return os.path.join(self._tmp, f"part_{part:03d}.pkl")
+
+    def spill(self):
+        """Append the in-memory pairs to their key's partition file and clear memory."""
+        by_part = {}
+        for key, seen in self.groups.items():
+            by_part.setdefault(_partition(key), []).append((key, seen))
+        for part, items in by_part.items():
+            with open(self._partition_path(part), "ab") as fp:
+                pickle.dump(items, fp, protocol=pickle.HIGHEST_PROTOCOL)
+        self.groups, self.pairs, self.spilled = {}, 0, True
+
+    def _read_partition(self, part: int) -> dict:
+        merged = {}
+        path = self._partition_path(part)
+        if not os.path.exists(path):
+            return merged
+        with open(path, "rb") as fp:
+            while True:
+                try:
+                    items = pickle.load(fp)
+                except EOFError:
+                    break
+                for key, seen in items:
+                    target = merged.setdefault(key, {})
+                    for value, row in seen.items():
+                        if value not in target or row < target[value]:
+                            target[value] = row
+        return merged
+
+    def results(self) -> list[tuple]:
+        """[(key, [values in first-seen order])], sorted by key."""
+        if not self.spilled:
+            parts = [self.groups]
+        else:
+            self.spill()
+            parts = (self._read_partition(p) for p in range(NUM_PARTITIONS))
+        out = []
+        for groups in parts:
+            for key, seen in groups.items():
+                out.append((key, sorted(seen, key=seen.__getitem__)))
+        out.sort(key=lambda kv: kv[0])
+        return out
+
+    def close(self):
+        if self._tmp is not None:
+            shutil.rmtree(self._tmp, ignore_errors=True)
+            self._tmp = None
+
+
+def group_distinct(path: str, key_column, value_column, dropna_values: bool = False,
+                   chunksize: int = CHUNK_ROWS, max_pairs: int = MAX_PAIRS_IN_MEMORY,
+                   spill_dir: str | None = None) -> list[tuple]:
+    """
+    Distinct `value_column` values per `key_column` value (names or 0-based
+    positions), first-seen order, keys sorted. Rows with a missing key are
+    skipped (groupby's dropna); missing values too when `dropna_values`.
+    """
+    header = pd.read_csv(path, nrows=0).columns.tolist()
+    key_col = _resolve_column(header, key_column)
+    value_col = _resolve_column(header, value_column)
+
+    store = _SpillStore(max_pairs, spill_dir)
+    try:
+        row = 0
+        for chunk in pd.read_csv(path, usecols=[key_col, value_col], dtype=str, chunksize=chunksize):
+            n = len(chunk)
+            chunk = chunk.dropna(subset=[key_col, value_col] if dropna_values else [key_col])
+            # NaN values -> None so they compare equal as dict keys
+            values = chunk[value_col].astype(object).where(chunk[value_col].notna(), None)
+            store.add(chunk[key_col], values, row)
+            row += n
+        nan = float("nan")
+        return [(key, [nan if v is None else v for v in values]) for key, values in store.results()]
+    finally:
+        store.close()
+
+
+# ─── INCREMENTAL STORE ───
+
+def _as_key(value):
+    return None if isinstance(value, float) and pd.isna(value) else value
+
+
+def load_group_store(store_path: str) -> dict | None:
+    """Previous run's store, or None when missing / unreadable / another version."""
+    if not os.path.exists(store_path):
+        return None
+    try:
+        with open(store_path, "rb") as fp:
+            store = pickle.load(fp)
+    except Exception:
+        return None
+    return store if store.get("version") == GROUP_STORE_VERSION else None
+
+
+def file_sha256(path: str) -> str:
+    """SHA-256 of the file's bytes."""
+    h = hashlib.sha256()
+    with open(path, "rb") as fp:
+        for block in iter(lambda: fp.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def save_group_store(store_path: str, store: dict):
+    tmp_path = store_path + ".tmp"
+    with open(tmp_path, "wb") as fp:
+        pickle.dump(store, fp, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, store_path)
+
+
+def diff_groups(before: dict, after: dict, columns: list[str] = CHANGES_COLUMNS) -> pd.DataFrame:
+    """
+    Per-brand gained / lost values between two {brand: [values]} maps (changed
+    brands only), restricted to `columns`.
+    """
+    rows = []
+    for brand in sorted(set(before) | set(after)):
+        old = {_as_key(v) for v in before.get(brand, [])}
+        new = {_as_key(v) for v in after.get(brand, [])}
+        gained, lost = sorted(new - old, key=str), sorted(old - new, key=str)
+        if gained or lost:
+            rows.append({
+                "brand": brand,
+                "gained_count": len(gained),
+                "lost_count": len(lost),
+                "gained": ", ".join("(blank)" if v is None else str(v) for v in gained),
+                "lost": ", ".join("(blank)" if v is None else str(v) for v in lost),
+            })
+    return pd.DataFrame(rows, columns=CHANGES_COLUMNS)[columns]
+
+
+def apply_import(store_path: str, path: str, key_column, value_column, mode: str = "merge",
+                 dropna_values: bool = False, **kwargs) -> tuple[list[tuple], pd.DataFrame]:
+    """
+    Group `path` with group_distinct and fold it into the store at `store_path`.
+    Returns (groups sorted by key, report vs the previous run): gained and
+    lost values per brand in replace mode, gained only in merge mode (values
+    are only ever added there). In merge mode an import already applied
+    (same content hash) is not counted twice. Other keyword arguments go to
+    group_distinct.
+    """
+    if mode not in STORE_MODES:
+        raise ValueError(f"Unknown store mode '{mode}' (expected one of {STORE_MODES})")
+
+    store = load_group_store(store_path) or {
+        "version": GROUP_STORE_VERSION, "groups": {}, "sources": [],
+    }
+    before = store["groups"]
+    source = {"file": os.path.basename(path), "sha256": file_sha256(path)}
+    already = any(s.get("sha256") == source["sha256"] for s in store["sources"])
+
+    if mode == "merge" and already:
+        after = before
+    else:
+        fresh = dict(group_distinct(path, key_column, value_column, dropna_values, **kwargs))
+        if mode == "replace":
+            after = fresh
+        else:
+            after = {brand: list(values) for brand, values in before.items()}
+            for brand, values in fresh.items():
+                merged = after.setdefault(brand, [])
+                seen = {_as_key(v) for v in merged}
+                merged.extend(v for v in values if _as_key(v) not in seen)
+
+    changes = diff_groups(before, after, CHANGES_COLUMNS if mode == "replace" else MERGE_CHANGES_COLUMNS)
+    if after is not before:
+        source["applied"] = datetime.datetime.now().isoformat(timespec="seconds")
+        source["mode"] = mode
+        store["groups"] = after
+        store["sources"] = ([] if mode == "replace" else store["sources"]) + [source]
+        save_group_store(store_path, store)
+
+    return sorted(after.items(), key=lambda kv: kv[0]), changes
+
+
+def print_groups(groups: list[tuple], label: str, verbose: bool = False):
+    """Print every group (verbose) or a short summary."""
+    if verbose:
+        for key, values in groups:
+            print(f"Brand: {key}")
+            print(f"{label}: {', '.join(str(v) for v in values)}\n")
+        return
+    total = sum(len(values) for _, values in groups)
+    print(f"{len(groups)} brand(s), {total} distinct {label.lower()}")
+    for key, values in groups[:5]:
+        print(f"  {key}: {len(values)}")
+    if len(groups) > 5:
+        print(f"  ... {len(groups) - 5} more")
@@ -0,0 +1,121 @@
+"""
+import_schema.py
+
+Schema registry for the brand import files.
+
+The column lists come from MASTER_RULES in master_rules.py; this module
+adds a dtype kind per column so loaders can ask for just the columns they
+need, already typed:
+ - "category": low-cardinality labels (store, category, memory_type, ...)
+   stored once per distinct value instead of once per row;
+ - "int" / "float": pandas nullable Int64 / Float64 (blank -> <NA>);
+ - "string": everything else; plain str, or Arrow-backed strings when
+   ARROW_STRINGS is set and pyarrow is installed.
+
+read_typed(path, brand, usecols) reads with those dtypes and, if a numeric
+column holds text (dirty import), retries once with numeric columns as text.
+"""
+
+import os
+
+from ingest import HAS_PYARROW, load_table, read_header
+from master_rules import MASTER_RULES
+
+# Arrow-backed strings use less memory, but NaN becomes <NA> (astype(str)
+# gives '<NA>', not 'nan'); off until every consumer handles that.
+ARROW_STRINGS = False
+
+CATEGORY_COLUMNS = {
+    'store', 'category', 'a', 'b', 'oem', 'memory_type', 'dimm_type', 'ecc',
+    'voltage', 'height', 'form_factor', 'interface', 'chipset', 'encode_status',
+    'product_status', 'server_form_factor', 'gen', 'processor_sockets',
+}
+INT_COLUMNS = {'dimm_slots', 'ranks', 'rank_width', 'qty'}
+FLOAT_COLUMNS = {'speed', 'capacity_in_gb', 'capacity_in_tb', 'dwpd'}
+
+NUMERIC_KINDS = ('int', 'float')
+
+
+def column_kind(column: str) -> str:
+    """Dtype kind of a (normalized, lowercase) column name."""
+    if column in CATEGORY_COLUMNS:
+        return 'category'
+    if column in INT_COLUMNS:
+        return 'int'
+    if column in FLOAT_COLUMNS:
+        return 'float'
+    return 'string'
+
+
+def kind_dtype(kind: str):
+    """pandas dtype for a kind."""
+    if kind == 'category':
+        return 'category'
+    if kind == 'int':
+        return 'Int64'
+    if kind == 'float':
+        return 'Float64'
+    return 'string[pyarrow]' if ARROW_STRINGS and HAS_PYARROW else str
+
+
+def brand_schema(brand: str) -> dict[str, str]:
+    """{column: kind} for every required column of `brand` in MASTER_RULES."""
+    return {col: column_kind(col) for col in MASTER_RULES[brand]}
+
+
+def schema_dtypes(header: list[str], numeric: bool = True) -> dict:
+    """
+    {actual header name: dtype} for the given header names, matched on the
+    stripped, lowercased name. With numeric=False int/float columns stay text.
+    """
+    dtypes = {}
+    for name in header:
+        kind = column_kind(str(name).strip().lower())
+        if not numeric and kind in NUMERIC_KINDS:
+            kind = 'string'
+        dtypes[name] = kind_dtype(kind)
+    return dtypes
+
+
+def resolve_usecols(header: list[str], columns) -> list[str]:
+    """Actual header names whose stripped, lowercased form is in `columns`."""
+    wanted = {c.strip().lower() for c in columns}
+    return [name for name in header if str(name).strip().lower() in wanted]
+
+
+def read_typed(path: str, brand: str | None = None, usecols=None, numeric: bool = True):
+    """
+    Load `path` with schema dtypes. Columns: `usecols` (normalized names) if
+    given, else the brand's MASTER_RULES columns if `brand` is given, else all.
+    Falls back to text for int/float columns when the typed parse fails.
+    """
+    header = read_header(path)
+    if usecols is not None:
+        keep = resolve_usecols(header, usecols)
+    elif brand is not None:
+        keep = resolve_usecols(header, brand_schema(brand))
+    else:
+        keep = list(header)
+
+    try:
+        return load_table(path, usecols=keep, dtype=schema_dtypes(keep, numeric))
+    except (ValueError, TypeError):
+        if not numeric:
+            raise
+        # dirty numeric column (e.g. '3200 MHz'): keep those as text
+        return load_table(path, usecols=keep, dtype=schema_dtypes(keep, numeric=False))
+
+
+def memory_report(path: str, brand: str | None = None) -> tuple[int, int]:
+    """(bytes as all-str, bytes with schema dtypes) for one import: quick check of the savings."""
+    plain = load_table(path, dtype=str).memory_usage(deep=True).sum()
+    typed = read_typed(path, brand).memory_usage(deep=True).sum()
+    return int(plain), int(typed)
+
+
+if __name__ == "__main__":
+    import sys
+    for p in sys.argv[1:]:
+        plain, typed = memory_report(p)
+        print(f"{os.path.basename(p)}: {plain / 1e6:.1f} MB as str -> {typed / 1e6:.1f} MB typed "
+              f"({plain / max(typed, 1):.1f}x)")
@@ -0,0 +1,378 @@
+"""
+ingest.py
+
+Shared table loader for the brand import files (CSV / XLS / XLSX).
+
+load_table(path, usecols=None, dtype=None) picks the read path from the
+file extension and size:
+ - CSV:          pandas read_csv with the requested columns only.
+ - small .xlsx:  streamed openpyxl read-only pass that keeps only the
+                 requested columns (no full-workbook object model).
+ - large .xlsx:  (>= EXCEL_CACHE_MIN_BYTES, pyarrow installed) converted once
+                 to a columnar Parquet file under EXCEL_CACHE_DIR next to the
+                 workbook; later loads read only the requested columns from
+                 it. The cache key includes the workbook size and mtime, so
+                 an updated workbook is re-converted automatically.
+
+iter_table(...) yields the same data in row chunks, so scanners can stop
+reading as soon as they have their answer.
+
+read_csv_fast(path, ...) is the CSV reader behind both: pyarrow's
+multithreaded parser with column selection (pandas' C engine otherwise, or
+when Arrow rejects the file). It keeps pandas read_csv semantics - missing
+values are NaN, dates stay text - unless arrow_dtypes=True asks for
+Arrow-backed columns, where missing values are <NA>.
+
+Headers follow pandas conventions (blank -> "Unnamed: N", duplicates ->
+"name.1"), so callers see the same column names as pd.read_excel.
+Legacy .xls workbooks go straight to pd.read_excel.
+"""
+
+import os
+import glob
+import datetime
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401  (Parquet cache for large workbooks)
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+EXCEL_EXTENSIONS = (".xls", ".xlsx")
+EXCEL_CACHE_DIR = ".ingest_cache"
+EXCEL_CACHE_MIN_BYTES = 5 * 1024 * 1024  # 5 MB workbook ~ tens of thousands of rows
+
+# Arrow is the default CSV engine when pyarrow is installed
+USE_ARROW_CSV = True
+
+# pandas' default NA strings, so Arrow nulls match read_csv's NaN
+CSV_NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+]
+
+
+# ─── HELPERS ───
+
+def is_excel(path: str) -> bool:
+    return os.path.splitext(path)[1].lower() in EXCEL_EXTENSIONS
+
+
+def _header_names(raw) -> list[str]:
+    """Apply pandas' header rules: blank -> 'Unnamed: N', repeated names -> 'name.1', 'name.2'."""
+    names, seen = [], {}
+    for i, h in enumerate(raw):
+        name = f"Unnamed: {i}" if h is None or str(h).strip() == "" else str(h)
+        base = name
+        while name in seen:
+            seen[base] += 1
+            name = f"{base}.{seen[base]}"
+        seen.setdefault(name, 0)
+        names.append(name)
+    return names
+
+
+def _select(names: list[str], usecols) -> list[str]:
+    """Resolve `usecols` (None, list of names, or callable on a name) against header names."""
+    if usecols is None:
+        return list(names)
+    if callable(usecols):
+        return [n for n in names if usecols(n)]
+    wanted = set(usecols)
+    missing = wanted - set(names)
+    if missing:
+        raise ValueError(f"Usecols do not match columns, columns expected but not found: {sorted(missing)}")
+    return [n for n in names if n in wanted]
+
+
+def _cell_to_str(v):
+    """Stringify one Excel cell the way pd.read_excel(dtype=str) does."""
+    if v is None:
+        return None
+    if isinstance(v, float) and v.is_integer():
+        return str(int(v))
+    if isinstance(v, datetime.datetime):
+        return str(pd.Timestamp(v))
+    return str(v)
+
+
+def _missing_as_nan(df: pd.DataFrame) -> pd.DataFrame:
+    """openpyxl/Parquet give None for empty cells; pandas readers give NaN."""
+    obj = df.select_dtypes(include="object").columns
+    if len(obj):
+        df[obj] = df[obj].where(df[obj].notna(), np.nan)
+    return df
+
+
+def _blank_as_float(col: pd.Series) -> pd.Series:
+    """An inferred column with no values at all is float64 NaN, as in read_csv / read_excel."""
+    if col.dtype == object and col.isna().all():
+        return col.astype("float64")
+    return col
+
+
+def _finalize(df: pd.DataFrame, dtype) -> pd.DataFrame:
+    """Apply `dtype` (str, dict, or None for inference) to a frame of raw cell objects."""
+    if dtype is str:
+        for col in df.columns:
+            df[col] = df[col].map(_cell_to_str)
+    elif isinstance(dtype, dict):
+        for col in df.columns:
+            typ = dtype.get(col)
+            if typ is str:
+                df[col] = df[col].map(_cell_to_str)
+            elif typ is not None:
+                df[col] = df[col].astype(typ)
+            else:
+                df[col] = _blank_as_float(df[col].infer_objects())
+    else:
+        df = df.infer_objects().apply(_blank_as_float)
+    return _missing_as_nan(df)
+
+
+def _infer_from_text(df: pd.DataFrame, dtype=None) -> pd.DataFrame:
+    """Re-type text columns read back from the Parquet cache according to `dtype`."""
+    for col in df.columns:
+        typ = dtype.get(col) if isinstance(dtype, dict) else dtype
+        if typ is str:
+            continue
+        if typ is not None:
+            df[col] = df[col].astype(typ)
+            continue
+        try:
+            df[col] = pd.to_numeric(df[col])
+        except (ValueError, TypeError):
+            pass
+    return _missing_as_nan(df)
+
+
+# ─── CSV: ARROW MULTITHREADED READ ───
+
+def _read_csv_arrow(path: str, usecols=None, dtype=None, encoding=None, arrow_dtypes=False) -> pd.DataFrame:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+
+    # pandas' header rules (blank -> "Unnamed: N", repeated -> "name.1")
+    names = pd.read_csv(path, nrows=0, encoding=encoding).columns.tolist()
+    keep = _select(names, usecols)
+    # str / category columns are parsed as text, like read_csv(dtype=...) does
+    if isinstance(dtype, dict):
+        text = {c for c, t in dtype.items() if c in keep and (t is str or t == "category")}
+    elif dtype is str or dtype == "category":
+        text = set(keep)
+    else:
+        text = set()
+
+    def read(text_cols):
+        return pacsv.read_csv(
+            path,
+            read_options=pacsv.ReadOptions(column_names=names, skip_rows=1,
+                                           encoding=encoding or "utf8"),
+            convert_options=pacsv.ConvertOptions(
+                include_columns=keep,
+                column_types={c: pa.string() for c in text_cols},
+                null_values=CSV_NA_VALUES,
+                strings_can_be_null=True,
+            ),
+        )
+
+    table = read(text)
+    # read_csv does not parse dates: re-read any column Arrow made temporal as text
+    temporal = {f.name for f in table.schema if pa.types.is_temporal(f.type)}
+    if temporal:
+        table = read(text | temporal)
+
+    # an all-blank column is Arrow's null type (object/None in pandas); read_csv gives float64 NaN
+    for i, field in enumerate(table.schema):
+        if pa.types.is_null(field.type) and field.name not in text:
+            table = table.set_column(i, field.name, table.column(i).cast(pa.float64()))
+
+    if arrow_dtypes:
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+    df = table.to_pandas()
+    if isinstance(dtype, dict):
+        for col, typ in dtype.items():
+            if col in df.columns and typ is not str:
+                df[col] = df[col].astype(typ)
+    elif dtype is not None and dtype is not str:
+        df = df.astype(dtype)
+    return _missing_as_nan(df)
+
+
+def read_csv_fast(path: str, usecols=None, dtype=None, encoding=None, arrow_dtypes=False) -> pd.DataFrame:
+    """
+    pd.read_csv replacement: Arrow's multithreaded parser reading only
+    `usecols` (list of names), C engine fallback when pyarrow is missing or
+    the file is something Arrow rejects (ragged rows, bad encoding, ...).
+    `dtype` as for load_table. arrow_dtypes=True returns Arrow-backed columns.
+    """
+    if USE_ARROW_CSV and HAS_PYARROW and not callable(usecols):
+        import pyarrow as pa
+        try:
+            return _read_csv_arrow(path, usecols, dtype, encoding, arrow_dtypes)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError, UnicodeDecodeError):
+            pass
+    df = pd.read_csv(path, usecols=usecols, dtype=dtype, encoding=encoding, low_memory=False)
+    return df.convert_dtypes(dtype_backend="pyarrow") if arrow_dtypes else df
+
+
+# ─── EXCEL: STREAMED READ-ONLY ───
+
+def read_excel_header(path: str) -> list[str]:
+    """Header names of the first sheet, reading only its first row."""
+    import openpyxl
+    wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        first = next(wb.worksheets[0].iter_rows(max_row=1, values_only=True), ())
+    finally:
+        wb.close()
+    return _header_names(first)
+
+
+def _iter_excel_streamed(path: str, usecols=None, chunksize: int | None = None):
+    """
+    Stream the first sheet row by row, yielding frames of raw cell values of
+    the selected columns, `chunksize` rows at a time (all rows if None).
+    """
+    import openpyxl
+    wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = wb.worksheets[0].iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            yield pd.DataFrame()
+            return
+        names = _header_names(header)
+        keep = _select(names, usecols)
+        positions = [names.index(n) for n in keep]
+        data = {n: [] for n in keep}
+        count = blank_run = 0
+        for row in rows:
+            if all(v is None for v in row):
+                blank_run += 1  # read_excel keeps inner blank rows, drops trailing ones
+                continue
+            for values in [(None,) * len(names)] * blank_run + [row]:
+                for name, pos in zip(keep, positions):
+                    data[name].append(values[pos] if pos < len(values) else None)
+                count += 1
+                if chunksize and count == chunksize:
+                    yield pd.DataFrame(data, columns=keep, dtype=object)
+                    data, count = {n: [] for n in keep}, 0
+            blank_run = 0
+        if count or not chunksize:
+            yield pd.DataFrame(data, columns=keep, dtype=object)
+    finally:
+        wb.close()
+
+
+def _read_excel_streamed(path: str, usecols=None) -> pd.DataFrame:
+    """Stream the first sheet row by row, keeping raw cell values of the selected columns."""
+    return next(_iter_excel_streamed(path, usecols))
+
+
+# ─── EXCEL: ONE-TIME COLUMNAR CACHE ───
+
+def _excel_cache_path(path: str) -> str:
+    st = os.stat(path)
+    base = os.path.basename(path)
+    return os.path.join(os.path.dirname(os.path.abspath(path)), EXCEL_CACHE_DIR,
+                        f"{base}.{st.st_size}-{st.st_mtime_ns}.parquet")
+
+
+def convert_excel_to_cache(path: str) -> str:
+    """Convert the workbook's first sheet (all columns, as text) to Parquet; return the cache path."""
+    cache_path = _excel_cache_path(path)
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    df = _finalize(_read_excel_streamed(path), str)
+    tmp_path = cache_path + ".tmp"
+    df.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, cache_path)
+
+    # drop caches of older versions of the same workbook
+    prefix = os.path.join(os.path.dirname(cache_path), os.path.basename(path) + ".")
+    for stale in glob.glob(glob.escape(prefix) + "*.parquet"):
+        if stale != cache_path:
+            os.remove(stale)
+    return cache_path
+
+
+def _cached_excel_columns(path: str, usecols=None) -> tuple[str, list[str]]:
+    """Convert the workbook on first use; return (cache path, selected columns)."""
+    import pyarrow.parquet as pq
+    cache_path = _excel_cache_path(path)
+    if not os.path.exists(cache_path):
+        convert_excel_to_cache(path)
+    return cache_path, _select(pq.read_schema(cache_path).names, usecols)
+
+
+def _read_excel_cached(path: str, usecols=None, dtype=None) -> pd.DataFrame:
+    cache_path, keep = _cached_excel_columns(path, usecols)
+    df = pd.read_parquet(cache_path, columns=keep)
+    return _infer_from_text(df, dtype)
+
+
+def _iter_excel_cached(path: str, usecols=None, dtype=None, chunksize: int = 100_000):
+    import pyarrow.parquet as pq
+    cache_path, keep = _cached_excel_columns(path, usecols)
+    for batch in pq.ParquetFile(cache_path).iter_batches(batch_size=chunksize, columns=keep):
+        yield _infer_from_text(batch.to_pandas(), dtype)
+
+
+# ─── PUBLIC LOADER ───
+
+def read_header(path: str) -> list[str]:
+    """Column names only: nrows=0 for CSV / .xls, first row only for .xlsx."""
+    if not is_excel(path):
+        return pd.read_csv(path, nrows=0).columns.tolist()
+    if path.lower().endswith(".xls"):
+        return pd.read_excel(path, nrows=0).columns.tolist()
+    return read_excel_header(path)
+
+
+def load_table(path: str, usecols=None, dtype=None, cache: bool = True) -> pd.DataFrame:
+    """
+    Load a CSV or Excel import, choosing the fastest path for its extension
+    and size. `usecols` is a list of header names or a callable on a name;
+    `dtype` is None (infer), str, or a {column: type} dict.
+    """
+    if not is_excel(path):
+        return read_csv_fast(path, usecols=usecols, dtype=dtype)
+    if path.lower().endswith(".xls"):
+        # legacy binary workbooks: openpyxl cannot stream them
+        return pd.read_excel(path, usecols=usecols, dtype=dtype)
+
+    if cache and HAS_PYARROW and os.path.getsize(path) >= EXCEL_CACHE_MIN_BYTES:
+        return _read_excel_cached(path, usecols, dtype)
+    return _finalize(_read_excel_streamed(path, usecols), dtype)
+
+
+def _running_index(chunks):
+    """Renumber chunks that each start at 0 so the row index keeps counting, like read_csv chunks."""
+    start = 0
+    for chunk in chunks:
+        chunk.index = pd.RangeIndex(start, start + len(chunk))
+        start += len(chunk)
+        yield chunk
+
+
+def iter_table(path: str, usecols=None, dtype=None, chunksize: int = 100_000, cache: bool = True):
+    """
+    Yield the import in frames of at most `chunksize` rows, same columns and
+    dtypes as load_table. The row index counts on across chunks for every
+    file type. Lets callers stop reading early.
+    """
+    if not is_excel(path):
+        yield from pd.read_csv(path, usecols=usecols, dtype=dtype, chunksize=chunksize)
+        return
+    if path.lower().endswith(".xls"):
+        df = pd.read_excel(path, usecols=usecols, dtype=dtype)
+        for start in range(0, len(df), chunksize):
+            yield df.iloc[start:start + chunksize]
+        return
+
+    if cache and HAS_PYARROW and os.path.getsize(path) >= EXCEL_CACHE_MIN_BYTES:
+        yield from _running_index(_iter_excel_cached(path, usecols, dtype, chunksize))
+        return
+    yield from _running_index(_finalize(chunk, dtype) for chunk in _iter_excel_streamed(path, usecols, chunksize))
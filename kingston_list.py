@@ -1,46 +1,63 @@
-import pandas as pd
-
-# Specify the file path of your CSV file
-file_path = 'kingston.csv'  # Replace with the actual CSV file path
-
-# Load the CSV file into a DataFrame
-try:
-    df = pd.read_csv(file_path)
-except Exception as e:
-    print(f"Error reading the CSV file: {e}")
-    exit(1)  # Exit if there's an error loading the file
-
-# Print the column names to inspect the structure of your data
-print("Columns in the CSV file:", df.columns)
-
-# Display the first few rows of the dataframe (to check the structure)
-print(df.head())
-
-# Assuming the first column is for brand names and the second column is for product names
-brand_column = df.columns[0]  # The first column might be the brand column
-product_column = df.columns[1]  # Assuming the second column contains product names
-
-# Check if the columns exist in the dataframe
-if brand_column not in df.columns or product_column not in df.columns:
-    print(f"Error: Columns '{brand_column}' or '{product_column}' not found in the data.")
-    exit(1)
-
-# Remove duplicate product names (keep only the first occurrence of each product per brand)
-df_unique = df.drop_duplicates(subset=[brand_column, product_column])
-
-# Group products by brand
-grouped = df_unique.groupby(brand_column)[product_column].apply(list).reset_index()
-
-# Save the grouped data to a new CSV file
-output_file = 'unique_products_by_brand.csv'
-grouped.to_csv(output_file, index=False)
-
-# Print the grouped data by brand
-for _, row in grouped.iterrows():
-    brand = row[brand_column]
-    products = row[product_column]
-    print(f"Brand: {brand}")
-    print(f"Products: {', '.join(products)}\n")
-
-# Optionally, display the result file location
-print(f"The grouped unique product names by brand have been saved to '{output_file}'")
\ No newline at end of file
+import pandas as pd
+
+from brand_grouping import group_distinct, apply_import, print_groups
+
+# Specify the file path of your CSV file
+file_path = 'kingston.csv'  # Replace with the actual CSV file path
+
+# Print every brand and its products (False: short summary only)
+VERBOSE = False
+
+# Incremental mode: keep the per-brand groups in STORE_FILE between daily imports.
+#  'merge'   adds this file's rows to the stored groups (brands only gain products),
+#  'replace' treats this file as the full current snapshot.
+# Brands that gained (merge) or gained / lost (replace) products since the previous
+# run go to CHANGES_FILE.
+INCREMENTAL  = False
+STORE_FILE   = 'brand_product_store.pkl'
+STORE_MODE   = 'merge'
+CHANGES_FILE = 'brand_product_changes.csv'
+
+# Read only the header to inspect the structure of your data
+try:
+    columns = pd.read_csv(file_path, nrows=0).columns
+except Exception as e:
+    print(f"Error reading the CSV file: {e}")
+    exit(1)  # Exit if there's an error loading the file
+
+# Print the column names to inspect the structure of your data
+print("Columns in the CSV file:", columns)
+
+# Assuming the first column is for brand names and the second column is for product names
+if len(columns) < 2:
+    print("Error: Expected a brand column and a product column in the data.")
+    exit(1)
+brand_column = columns[0]  # The first column might be the brand column
+product_column = columns[1]  # Assuming the second column contains product names
+
+# Stream the two columns in chunks; unique product names per brand, first occurrence order
+try:
+    if INCREMENTAL:
+        groups, changes = apply_import(STORE_FILE, file_path, brand_column, product_column, STORE_MODE)
+    else:
+        groups = group_distinct(file_path, brand_column, product_column)
+except Exception as e:
+    print(f"Error reading the CSV file: {e}")
+    exit(1)
+
+grouped = pd.DataFrame(groups, columns=[brand_column, product_column])
+
+# Save the grouped data to a new CSV file
+output_file = 'unique_products_by_brand.csv'
+grouped.to_csv(output_file, index=False)
+
+# Print the grouped data by brand
+print_groups(groups, "Products", verbose=VERBOSE)
+
+# Report brands that gained / lost products since the previous run
+if INCREMENTAL:
+    changes.to_csv(CHANGES_FILE, index=False)
+    print(f"{len(changes)} brand(s) changed since the previous run; details in '{CHANGES_FILE}'")
+
+# Optionally, display the result file location
+print(f"The grouped unique product names by brand have been saved to '{output_file}'")
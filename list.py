@@ -1,38 +1,55 @@
-import pandas as pd
-
-# Specify the file path of your CSV file
-file_path = open('./11122024_kingston_db_import_ssd_encoded.csv')  # Replace with the actual file path
-
-# Load the CSV file into a DataFrame
-try:
-    df = pd.read_csv(file_path, low_memory=False)  # Set low_memory=False to handle large files
-except Exception as e:
-    print(f"Error reading the CSV file: {e}")
-    exit(1)  # Exit if there's an error loading the file
-
-# Assuming 'A' column is for brand names and 'B' column contains model categories
-brand_column = 'A'  # Column for brands
-model_column = 'B'  # Column for higher-level model categories
-
-# Filter only relevant columns and remove duplicates
-brand_model_data = df[[brand_column, model_column]].drop_duplicates()
-
-# Remove rows with missing or invalid model names
-brand_model_data = brand_model_data.dropna()
-
-# Group by brand and collect distinct model categories into lists
-brand_models = brand_model_data.groupby(brand_column)[model_column].apply(lambda x: ', '.join(sorted(x.unique()))).reset_index()
-
-# Save the cleaned data to a CSV file
-output_file = 'brand_model_categories_11122024_kingston.csv'
-brand_models.to_csv(output_file, index=False)
-
-# Print the output
-for _, row in brand_models.iterrows():
-    brand = row[brand_column]
-    models = row[model_column]
-    print(f"Brand: {brand}")
-    print(f"Models: {models}\n")
-
-# Notify where the file is saved
-print(f"The cleaned brand and model categories have been saved to '{output_file}'")
\ No newline at end of file
+import pandas as pd
+
+from brand_grouping import group_distinct, apply_import, print_groups
+
+# Specify the file path of your CSV file
+file_path = './11122024_kingston_db_import_ssd_encoded.csv'  # Replace with the actual file path
+
+# Print every brand and its models (False: short summary only)
+VERBOSE = False
+
+# Incremental mode: keep the per-brand groups in STORE_FILE between daily imports.
+#  'merge'   adds this file's rows to the stored groups (brands only gain models),
+#  'replace' treats this file as the full current snapshot.
+# Brands that gained (merge) or gained / lost (replace) models since the previous
+# run go to CHANGES_FILE.
+INCREMENTAL  = False
+STORE_FILE   = 'brand_model_store.pkl'
+STORE_MODE   = 'merge'
+CHANGES_FILE = 'brand_model_changes.csv'
+
+# Assuming 'A' column is for brand names and 'B' column contains model categories
+brand_column = 'A'  # Column for brands
+model_column = 'B'  # Column for higher-level model categories
+
+# Stream the two columns in chunks and collect distinct model categories per brand
+# (rows with a missing brand or model are skipped)
+try:
+    if INCREMENTAL:
+        groups, changes = apply_import(STORE_FILE, file_path, brand_column, model_column,
+                                       STORE_MODE, dropna_values=True)
+    else:
+        groups = group_distinct(file_path, brand_column, model_column, dropna_values=True)
+except Exception as e:
+    print(f"Error reading the CSV file: {e}")
+    exit(1)  # Exit if there's an error loading the file
+
+brand_models = pd.DataFrame(
+    [(brand, ', '.join(sorted(models))) for brand, models in groups],
+    columns=[brand_column, model_column],
+)
+
+# Save the cleaned data to a CSV file
+output_file = 'brand_model_categories_11122024_kingston.csv'
+brand_models.to_csv(output_file, index=False)
+
+# Print the output
+print_groups(groups, "Models", verbose=VERBOSE)
+
+# Report brands that gained / lost models since the previous run
+if INCREMENTAL:
+    changes.to_csv(CHANGES_FILE, index=False)
+    print(f"{len(changes)} brand(s) changed since the previous run; details in '{CHANGES_FILE}'")
+
+# Notify where the file is saved
+print(f"The cleaned brand and model categories have been saved to '{output_file}'")
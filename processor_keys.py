@@ -0,0 +1,194 @@
+"""
+processor_keys.py
+
+Structured processor keys for matching processor names across the Acer,
+Intel and AMD/Kingston files.
+
+parse_processor("Intel Core i5-12400F") gives
+    ProcessorKey(vendor='intel', family='core i5', generation='12', model='12400', suffix='f')
+so spelling differences ("Intel(R) Core(TM) i5 12400F Processor", "core i5 12400 F")
+give the same key and two lists can be compared with a set / hash join
+instead of substring scans.
+
+ - vendor:     intel / amd (inferred from the family when not written);
+ - family:     product line plus tier words, e.g. "xeon gold", "ryzen 5 pro", "xeon e5";
+ - generation: derived from the model number where the line has a rule
+               (Core 12400 -> 12, Xeon Gold 6338 -> 3, Ryzen 5650 -> 5, EPYC 7302 -> 2)
+               or a Xeon "v4" token; blank where the number does not say
+               (4-digit mobile Core models such as 1135G7 / 1235U);
+ - model:      the model number with its letter prefix (g6400, 2620, 5650);
+ - suffix:     letters on the model token plus at most one directly following
+               short suffix token: "12400F", "12400 F", "7950X 3D" -> x3d.
+
+A name without a recognisable family and model number parses to None, and so
+does one with anything left after the model other than the suffix, a Xeon
+version and noise words ("... and 8380HL", "... 6M Cache up to 4.30 GHz"):
+such a name is not reduced to a key that ignores part of it.
+parse_processors() splits comma / slash lists ("Intel Core i5 12400/12500")
+and lets a bare model inherit vendor and family from the entry before it.
+Both are cached per distinct string; processor_keys() maps a whole column.
+"""
+
+import re
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+import pandas as pd
+
+CACHE_SIZE = 100_000
+
+INTEL_FAMILIES = {'xeon', 'core', 'pentium', 'celeron', 'atom'}
+AMD_FAMILIES = {'ryzen', 'epyc', 'athlon', 'sempron', 'opteron', 'phenom', 'turion', 'threadripper'}
+
+# AMD A-/E-/C-Series APUs are written as their model prefix: "AMD A8-7410", "AMD E2-3000"
+_APU_RE = re.compile(r'^(a|e|c)(\d{1,2})?$')
+_MARKS_RE = re.compile(r'®|™|\((?:r|tm)\)')
+NOISE_WORDS = {'processor', 'processors', 'cpu', 'series', 'family', 'apu'}
+# a separate suffix token: "F", "KF", "3D" - but not units or filler words
+_SUFFIX_TOKEN_RE = re.compile(r'^(?:[a-z]{1,3}|3d)$')
+NOT_SUFFIX = NOISE_WORDS | {'ghz', 'mhz', 'gb', 'mb', 'kb', 'tb', 'and', 'or', 'to', 'up', 'for',
+                            'with', 'box', 'oem', 'new'}
+_MODEL_RE = re.compile(r'^([a-z]{0,2})(\d{3,5})([a-z][a-z0-9]*)?$')
+_XEON_VERSION_RE = re.compile(r'^v\d$')
+_SPLIT_RE = re.compile(r'([,/])')
+
+
+class ProcessorKey(NamedTuple):
+    vendor: str
+    family: str
+    generation: str
+    model: str
+    suffix: str
+
+
+def _tokens(name: str) -> list[str]:
+    s = _MARKS_RE.sub(' ', name.lower())
+    return re.findall(r'[a-z0-9]+', s)
+
+
+def _generation(family: str, number: str, version: str) -> str:
+    line, *tier = family.split()
+    if line == 'xeon':
+        if version:
+            return version
+        if tier and tier[0] in ('platinum', 'gold', 'silver', 'bronze') and len(number) == 4:
+            return number[1]                    # Gold 6338 -> 3rd gen scalable
+        return ''
+    if line == 'core':
+        if tier and tier[0] == 'ultra':
+            return number[0]                    # Ultra 7 155H -> series 1
+        if tier and tier[0] in ('i3', 'i5', 'i7', 'i9') and len(number) > 3:
+            if len(number) == 4 and number[0] == '1':
+                return ''                       # mobile 1135G7 (11th), 1235U (12th)
+            return number[:-3]                  # 12400 -> 12, 8700 -> 8
+        return ''                               # Core 2 Duo E8400, Core M ...
+    if line in ('ryzen', 'threadripper'):
+        return number[0]                        # 5650G -> 5000 series
+    if line == 'epyc' and len(number) == 4:
+        return number[-1]                       # 7302 -> Rome (2nd gen)
+    return ''
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_processor(name: str, default_vendor: str = '', default_family: str = '') -> Optional[ProcessorKey]:
+    """
+    ProcessorKey for one processor name, or None if it has no model number.
+    default_vendor / default_family fill in a bare model ("12500" after
+    "Intel Core i5 12400/").
+    """
+    if not isinstance(name, str):
+        return None
+    tokens = _tokens(name)
+
+    vendor = next((t for t in tokens if t in ('intel', 'amd')), '')
+    family, tier, model_at = '', [], None
+    for i, tok in enumerate(tokens):
+        if tok in ('intel', 'amd') or tok in NOISE_WORDS:
+            continue
+        if not family:
+            if tok in INTEL_FAMILIES or tok in AMD_FAMILIES:
+                family = tok
+                continue
+            apu = _APU_RE.match(tok)
+            if apu and (vendor == 'amd' or default_vendor == 'amd'):
+                family = f"{apu.group(1)}-series"
+                if apu.group(2):
+                    tier.append(tok)
+                continue
+        m = _MODEL_RE.match(tok)
+        if m:
+            model_at = i
+            break
+        if family:
+            tier.append(tok)
+    if model_at is None:
+        return None
+
+    family = family or default_family
+    if not family:
+        return None
+    family = ' '.join([family] + tier) if tier else family
+    line = family.split()[0]
+    vendor = vendor or default_vendor or ('intel' if line in INTEL_FAMILIES else 'amd')
+
+    prefix, number, suffix = _MODEL_RE.match(tokens[model_at]).groups()
+    suffix = suffix or ''
+    # after the model: a Xeon "v4", noise words, and one suffix token ("F", "3D")
+    # right after the model; anything else means the name is more than one model
+    version = ''
+    for i, tok in enumerate(tokens[model_at + 1:]):
+        if line == 'xeon' and not version and _XEON_VERSION_RE.match(tok):
+            version = tok
+        elif tok in NOISE_WORDS:
+            continue
+        elif i == 0 and _SUFFIX_TOKEN_RE.match(tok) and tok not in NOT_SUFFIX:
+            suffix += tok
+        else:
+            return None
+    return ProcessorKey(
+        vendor=vendor,
+        family=family,
+        generation=_generation(family, number, version),
+        model=f"{prefix}{number}",
+        suffix=suffix,
+    )
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_processors(text: str) -> tuple:
+    """
+    Keys for a comma / slash separated list, in order; an entry that does
+    not parse gives None. After a slash a bare model keeps the previous
+    entry's vendor and family: "Intel Core i5 12400/12500" -> two keys.
+    """
+    if not isinstance(text, str):
+        return ()
+    keys, prev, sep = [], None, ''
+    for part in _SPLIT_RE.split(text):
+        if part in (',', '/'):
+            sep = part
+            continue
+        part = part.strip()
+        if not part:
+            continue
+        if sep == '/' and prev is not None:
+            key = parse_processor(part, prev.vendor, prev.family)
+        else:
+            key = parse_processor(part)
+        keys.append(key)
+        prev = key or prev
+    return tuple(keys)
+
+
+def key_set(text: str) -> Optional[frozenset]:
+    """Set of keys in a list string, or None if any entry does not parse."""
+    keys = parse_processors(text)
+    if not keys or any(k is None for k in keys):
+        return None
+    return frozenset(keys)
+
+
+def processor_keys(values: pd.Series) -> pd.Series:
+    """parse_processors over a column, evaluated once per distinct value."""
+    distinct = {v: parse_processors(v) for v in pd.unique(values)}
+    return values.map(distinct)
@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("rapidfuzz")
+
+from acer_kinkston_extended_processor import reconcile_no_match, server_model_tokens  # noqa: E402
+
+PROCESSORS = "Intel Xeon Silver 4210R"
+
+# (source server_description, destination server_description): a different server each time
+NEAR_MISSES = [
+    ("ProLiant DL380 Gen10", "ProLiant DL360 Gen10"),
+    ("ProLiant DL380 Gen10", "ProLiant DL380 Gen11"),
+    ("ThinkSystem SR650", "ThinkSystem SR630"),
+    ("PowerEdge R740", "PowerEdge R740xd"),
+]
+
+
+def no_match_frames(pairs):
+    """One NO_MATCH result row and one destination row per (source, destination) pair."""
+    results = pd.DataFrame({
+        'option_part_no': [f"P{i}" for i in range(len(pairs))],
+        'server_description': [src for src, _ in pairs],
+        'chipset': '',
+        'processor_src': PROCESSORS,
+        'processor_src_norm': PROCESSORS,
+        'all_amd_processor': np.nan,
+        'all_amd_processor_norm': '',
+        'test_result': 'NO_MATCH',
+        'reason': 'No matching row found in destination',
+    })
+    dest = pd.DataFrame({
+        'option_part_no': [f"P{i}" for i in range(len(pairs))],
+        'server_description': [dst for _, dst in pairs],
+        'chipset': '',
+        'all_amd_processor': PROCESSORS,
+    })
+    return results, dest
+
+
+@pytest.mark.parametrize("src, dst", NEAR_MISSES)
+def test_different_models_stay_no_match(src, dst):
+    results, dest = no_match_frames([(src, dst)])
+    out = reconcile_no_match(results, dest)
+    assert out.loc[0, 'test_result'] == 'NO_MATCH'
+    assert out.loc[0, 'fuzzy_server_description'] == ''
+
+
+def test_spelling_differences_match():
+    pairs = [
+        ("ProLiant DL380 Gen10", "PROLIANT  dl380-gen10"),
+        ("ThinkSystem SR650", "Thinksystem, SR650"),
+    ]
+    results, dest = no_match_frames(pairs)
+    out = reconcile_no_match(results, dest)
+    assert out['test_result'].tolist() == ['PASS', 'PASS']
+    assert out['fuzzy_server_description'].tolist() == [dst for _, dst in pairs]
+    assert out['fuzzy_score'].ge(90).all()
+
+
+def test_server_model_tokens():
+    assert server_model_tokens("ProLiant DL380 Gen10") == ('dl380', 'gen10')
+    assert server_model_tokens("PowerEdge R740xd") == ('r740xd',)
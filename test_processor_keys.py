@@ -0,0 +1,76 @@
+import pandas as pd
+import pytest
+
+from processor_keys import ProcessorKey, key_set, parse_processor, parse_processors, processor_keys
+
+CORE_I5_12400F = ProcessorKey('intel', 'core i5', '12', '12400', 'f')
+
+
+@pytest.mark.parametrize("name", [
+    "Intel Core i5-12400F",
+    "Intel(R) Core(TM) i5 12400F Processor",
+    "core i5 12400 F",
+])
+def test_spellings_give_one_key(name):
+    assert parse_processor(name) == CORE_I5_12400F
+
+
+@pytest.mark.parametrize("name, key", [
+    # module docstring: family, generation and model examples
+    ("Intel Xeon Gold 6338",   ProcessorKey('intel', 'xeon gold', '3', '6338', '')),
+    ("AMD Ryzen 5 PRO 5650G",  ProcessorKey('amd', 'ryzen 5 pro', '5', '5650', 'g')),
+    ("AMD EPYC 7302",          ProcessorKey('amd', 'epyc', '2', '7302', '')),
+    ("Intel Xeon E5-2620 v4",  ProcessorKey('intel', 'xeon e5', 'v4', '2620', '')),
+    ("Intel Pentium G6400",    ProcessorKey('intel', 'pentium', '', 'g6400', '')),
+    ("AMD Ryzen 9 7950X 3D",   ProcessorKey('amd', 'ryzen 9', '7', '7950', 'x3d')),
+    ("AMD Ryzen 7 5800X3D",    ProcessorKey('amd', 'ryzen 7', '5', '5800', 'x3d')),
+    # noise words and a Xeon version may follow the model
+    ("Intel Xeon E-2234 CPU",  ProcessorKey('intel', 'xeon e', '', '2234', '')),
+    ("Intel Xeon E5-2620 Processor v4", ProcessorKey('intel', 'xeon e5', 'v4', '2620', '')),
+    ("Intel Xeon E5-2620 v3 Processor", ProcessorKey('intel', 'xeon e5', 'v3', '2620', '')),
+    # 4-digit mobile Core models: the number does not give the generation
+    ("Intel Core i5-1135G7",   ProcessorKey('intel', 'core i5', '', '1135', 'g7')),
+    ("Intel Core i5-1235U",    ProcessorKey('intel', 'core i5', '', '1235', 'u')),
+    ("Intel Core i7-8565U",    ProcessorKey('intel', 'core i7', '8', '8565', 'u')),
+    # no generation rule outside i3/i5/i7/i9 and Ultra
+    ("Intel Core 2 Duo E8400", ProcessorKey('intel', 'core 2 duo', '', 'e8400', '')),
+    ("Intel Core Ultra 7 155H", ProcessorKey('intel', 'core ultra 7', '1', '155', 'h')),
+])
+def test_parse_processor(name, key):
+    assert parse_processor(name) == key
+
+
+@pytest.mark.parametrize("name", [
+    "AMD A-Series APU (FM2+) AMD A10-series",
+    "Foo Bar 1",
+    None,
+    # more than one model, or text that is not a suffix, after the model
+    "Intel Xeon Platinum 8380H and 8380HL",
+    "Intel Core i3-10100 Processor 6M Cache up to 4.30 GHz",
+])
+def test_unparseable_is_none(name):
+    assert parse_processor(name) is None
+
+
+def test_slash_list_inherits_family():
+    assert parse_processors("Intel Core i5 12400/12500") == (
+        ProcessorKey('intel', 'core i5', '12', '12400', ''),
+        ProcessorKey('intel', 'core i5', '12', '12500', ''),
+    )
+    silver = parse_processors("Intel Xeon Silver 4210R, Intel Xeon Silver 4214/4216")
+    assert [k.model for k in silver] == ['4210', '4214', '4216']
+    assert {k.generation for k in silver} == {'2'}
+
+
+def test_key_set():
+    assert key_set("Intel Core i5-12400F, AMD EPYC 7302") == key_set("AMD Epyc 7302, core i5 12400 F")
+    assert key_set("Intel Core i5 12400, Foo Bar 1") is None
+    assert key_set("Intel Xeon E5-2620 Processor v4") != key_set("Intel Xeon E5-2620 Processor v3")
+    assert key_set("Intel Xeon Platinum 8380H and 8380HL") is None
+    assert key_set("") is None
+
+
+def test_processor_keys_column():
+    col = pd.Series(["Intel Core i5-12400F", None, "Intel Core i5-12400F"])
+    keys = processor_keys(col)
+    assert keys.tolist() == [(CORE_I5_12400F,), (), (CORE_I5_12400F,)]